@@ -7,12 +7,17 @@ schema detection, column type inference, and data quality assessment.
 
 import pandas as pd
 import numpy as np
+import os
 import re
+import logging
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional, Any
 from enum import Enum
 from dataclasses import dataclass
 import chardet
 
+logger = logging.getLogger(__name__)
+
 
 class ColumnType(Enum):
     """Enumeration of detected column types."""
@@ -60,6 +65,39 @@ class SchemaAnalysis:
     warnings: List[str]
 
 
+@lru_cache(maxsize=64)
+def _detect_encoding_cached(filepath: str, mtime_ns: int, size: int) -> str:
+    """Detect file encoding; mtime/size are part of the cache key only."""
+    with open(filepath, 'rb') as f:
+        result = chardet.detect(f.read(10000))
+    return result['encoding'] or 'utf-8'
+
+
+def _sample_as_str(series: pd.Series, n: int) -> pd.Series:
+    """
+    Return the first n non-null values of a series as strings.
+
+    Equivalent to series.dropna().astype(str).head(n), but only looks at
+    the head of the column unless it is too sparse to fill the sample.
+    """
+    sample = series.head(n * 3).dropna()
+    if len(sample) < n and len(series) > n * 3:
+        sample = series.dropna()
+    return sample.head(n).astype(str)
+
+
+def _is_fully_numeric(values: pd.Series) -> bool:
+    """
+    Check that every (non-null) value converts to a number.
+
+    Numeric dtypes are accepted without conversion; other columns are
+    coerced once and checked for failures instead of raising.
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        return True
+    return bool(pd.to_numeric(values, errors='coerce').notna().all())
+
+
 class ColumnTypeClassifier:
     """
     Classifies column types using pattern matching and statistical analysis.
@@ -165,7 +203,7 @@ class ColumnTypeClassifier:
     
     def _matches_time_patterns(self, series: pd.Series) -> bool:
         """Check if series matches time patterns."""
-        sample = series.dropna().astype(str).head(10)
+        sample = _sample_as_str(series, 10)
         if len(sample) == 0:
             return False
         
@@ -180,33 +218,26 @@ class ColumnTypeClassifier:
     
     def _is_numeric(self, series: pd.Series) -> bool:
         """Check if series is numeric."""
-        try:
-            pd.to_numeric(series.dropna(), errors='raise')
-            return True
-        except:
-            return False
+        return _is_fully_numeric(series.dropna())
     
     def _is_numeric_range(self, series: pd.Series, min_val: float, max_val: float) -> bool:
         """Check if series is numeric within a range."""
-        try:
-            numeric = pd.to_numeric(series.dropna(), errors='coerce')
-            if len(numeric) == 0:
-                return False
-            return numeric.between(min_val, max_val).mean() > 0.7
-        except:
+        numeric = pd.to_numeric(series.dropna(), errors='coerce')
+        if len(numeric) == 0:
             return False
+        return numeric.between(min_val, max_val).mean() > 0.7
     
     def _is_integer_range(self, series: pd.Series, min_val: int, max_val: int) -> bool:
         """Check if series contains integers within a range."""
-        try:
-            numeric = pd.to_numeric(series.dropna(), errors='coerce')
-            if len(numeric) == 0:
-                return False
-            is_int = (numeric == numeric.astype(int)).mean() > 0.9
-            in_range = numeric.between(min_val, max_val).mean() > 0.7
-            return is_int and in_range
-        except:
+        numeric = pd.to_numeric(series.dropna(), errors='coerce')
+        if len(numeric) == 0:
+            return False
+        # Non-numeric or infinite entries rule the column out entirely
+        if not np.isfinite(numeric).all():
             return False
+        is_int = (numeric == numeric.astype(int)).mean() > 0.9
+        in_range = numeric.between(min_val, max_val).mean() > 0.7
+        return is_int and in_range
     
     def _is_text(self, series: pd.Series) -> bool:
         """Check if series contains text."""
@@ -216,7 +247,7 @@ class ColumnTypeClassifier:
         """Check if series contains name-like text."""
         if not self._is_text(series):
             return False
-        sample = series.dropna().astype(str).head(10)
+        sample = _sample_as_str(series, 10)
         # Names typically have spaces or capital letters
         name_pattern = r'^[A-Z][a-z]+(\s[A-Z][a-z]+)*$'
         matches = sum(1 for val in sample if re.match(name_pattern, val.strip()))
@@ -224,8 +255,15 @@ class ColumnTypeClassifier:
     
     def _is_categorical(self, series: pd.Series) -> bool:
         """Check if series is categorical (low cardinality)."""
-        unique_ratio = series.nunique() / len(series) if len(series) > 0 else 0
-        return unique_ratio < 0.1 and series.nunique() < 20
+        n = len(series)
+        if n == 0:
+            return False
+        # Categorical means fewer than min(20, 10% of rows) distinct values.
+        # A sample can only undercount, so hitting the limit there is conclusive.
+        limit = min(20, 0.1 * n)
+        if series.head(1000).nunique() >= limit:
+            return False
+        return series.nunique() < limit
 
 
 class DataQualityAssessor:
@@ -283,21 +321,18 @@ class DataQualityAssessor:
             if len(non_null) == 0:
                 continue
             
-            # Try to convert to numeric
-            try:
-                pd.to_numeric(non_null, errors='raise')
+            if _is_fully_numeric(non_null):
                 scores.append(100)  # Fully consistent numeric
-            except:
-                # Check string consistency
-                if non_null.dtype == 'object':
-                    # Check if values have similar patterns
-                    unique_ratio = non_null.nunique() / len(non_null)
-                    if unique_ratio < 0.5:
-                        scores.append(80)  # Categorical-like
-                    else:
-                        scores.append(60)  # Free text
+            # Check string consistency
+            elif non_null.dtype == 'object':
+                # Check if values have similar patterns
+                unique_ratio = non_null.nunique() / len(non_null)
+                if unique_ratio < 0.5:
+                    scores.append(80)  # Categorical-like
                 else:
-                    scores.append(70)
+                    scores.append(60)  # Free text
+            else:
+                scores.append(70)
         
         return np.mean(scores) if scores else 50
 
@@ -307,15 +342,24 @@ class CSVSchemaAnalyzer:
     Main class for intelligent CSV schema analysis.
     """
     
+    # Files whose analysis is kept; the least recently analyzed is dropped first
+    CACHE_SIZE = 32
+    
     def __init__(self):
         """Initialize the analyzer."""
         self.classifier = ColumnTypeClassifier()
         self.quality_assessor = DataQualityAssessor()
+        # (path, sample_rows) -> ((mtime, size), analysis), in least recently used order
+        self._cache: Dict[Tuple, Tuple[Tuple, SchemaAnalysis]] = {}
     
     def analyze_file(self, filepath: str, sample_rows: int = 100) -> SchemaAnalysis:
         """
         Analyze a CSV file and detect its schema.
         
+        The latest result for each (path, sample_rows) is cached with the
+        file's mtime and size, so re-analyzing an unchanged file returns the
+        previous analysis. Up to CACHE_SIZE files are cached.
+        
         Args:
             filepath (str): Path to CSV file.
             sample_rows (int): Number of rows to sample for analysis.
@@ -323,6 +367,23 @@ class CSVSchemaAnalyzer:
         Returns:
             SchemaAnalysis: Complete analysis results.
         """
+        stat = os.stat(filepath)
+        key = (os.path.abspath(filepath), sample_rows)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.pop(key, None)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, self._analyze_file(filepath, sample_rows))
+        self._cache[key] = cached
+        if len(self._cache) > self.CACHE_SIZE:
+            del self._cache[next(iter(self._cache))]
+        return cached[1]
+    
+    def clear_cache(self):
+        """Discard all cached schema analyses."""
+        self._cache.clear()
+    
+    def _analyze_file(self, filepath: str, sample_rows: int) -> SchemaAnalysis:
+        """Run the full (uncached) schema analysis for a file."""
         # Detect encoding
         encoding = self._detect_encoding(filepath)
         
@@ -368,9 +429,8 @@ class CSVSchemaAnalyzer:
     
     def _detect_encoding(self, filepath: str) -> str:
         """Detect file encoding."""
-        with open(filepath, 'rb') as f:
-            result = chardet.detect(f.read(10000))
-        return result['encoding'] or 'utf-8'
+        stat = os.stat(filepath)
+        return _detect_encoding_cached(os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size)
     
     def _detect_delimiter(self, filepath: str, encoding: str) -> str:
         """
@@ -421,7 +481,7 @@ class CSVSchemaAnalyzer:
             return best_delim
             
         except Exception as e:
-            print(f"Error detecting delimiter: {e}")
+            logger.warning("Error detecting delimiter: %s", e)
             return ','  # Default to comma on error
     
     def _analyze_column(self, column_name: str, series: pd.Series) -> ColumnInfo:
@@ -457,18 +517,19 @@ class CSVSchemaAnalyzer:
     def _detect_patterns(self, series: pd.Series) -> List[str]:
         """Detect common patterns in column data."""
         patterns = []
-        sample = series.dropna().astype(str).head(20)
+        sample = _sample_as_str(series, 20)
         
         if len(sample) == 0:
             return patterns
         
-        # Check for time patterns
+        # Check for time patterns (one vectorized scan per pattern; a value
+        # may match several, e.g. HH:MM:SS also contains MM:SS)
         for pattern_name, pattern in [
             ('HH:MM:SS', r'\d{1,2}:\d{2}:\d{2}'),
             ('MM:SS', r'\d{1,2}:\d{2}'),
             ('+SS.sss', r'\+\d+\.\d+'),
         ]:
-            if any(re.search(pattern, str(val)) for val in sample):
+            if sample.str.contains(pattern, regex=True).any():
                 patterns.append(pattern_name)
         
         return patterns
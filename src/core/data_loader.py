@@ -3,6 +3,31 @@ import numpy as np
 from typing import Optional, Dict, Any
 import sys
 import os
+import logging
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.feather as pa_feather
+except ImportError:  # pyarrow is optional; used for CSV reading, caching and time parsing
+    pa = None
+    pc = None
+    pa_csv = None
+    pa_feather = None
+
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:  # numba is optional; time parsing falls back to pyarrow or parse_time_str
+    _HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
 
 # Import CSV intelligence modules
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))
@@ -15,6 +40,298 @@ except ImportError:
     DataSanitizer = None
     DataTransformer = None
 
+logger = logging.getLogger(__name__)
+
+# Time strings accepted by parse_time_str: [+]HH:MM:SS.sss, [+]MM:SS.sss, [+]SS.sss.
+# Hours are only captured when minutes are present, so "1:35.6" is MM:SS.
+_TIME_NUMBER = r'[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?'
+_TIME_PATTERN = (
+    rf'^\+?(?:(?:(?P<hours>{_TIME_NUMBER}):)?(?P<minutes>{_TIME_NUMBER}):)?'
+    rf'(?P<seconds>{_TIME_NUMBER})$'
+)
+
+
+def _is_arrow_string(series: pd.Series) -> bool:
+    """Check whether a series is backed by an Arrow string array."""
+    if pa is None:
+        return False
+    dtype = series.dtype
+    if isinstance(dtype, pd.ArrowDtype):
+        return pa.types.is_string(dtype.pyarrow_dtype) or pa.types.is_large_string(dtype.pyarrow_dtype)
+    return isinstance(dtype, pd.StringDtype) and dtype.storage == 'pyarrow'
+
+
+def _parse_time_arrow(series: pd.Series) -> pd.Series:
+    """
+    Vectorized equivalent of DataLoader.parse_time_str using pyarrow.compute.
+
+    Runs in Arrow compute kernels (regex extract, cast, arithmetic); only
+    rows the pattern rejects are re-parsed one by one. Arrow-backed columns
+    are used as-is; other columns are converted to an Arrow string array once.
+
+    Args:
+        series (pd.Series): Series of time values.
+
+    Returns:
+        pd.Series: Float64 seconds, NaN where parsing fails.
+    """
+    if _is_arrow_string(series):
+        values = pa.array(series.array)
+    else:
+        # NaN/None become 'nan'/'None', which fail the pattern like before
+        values = pa.array(series.astype(str).to_numpy(), type=pa.string())
+    values = pc.utf8_trim_whitespace(values)
+    parts = pc.extract_regex(values, _TIME_PATTERN)
+
+    def _field(index):
+        field = pc.struct_field(parts, [index])
+        # Optional groups that did not participate come back as empty strings
+        field = pc.if_else(pc.equal(field, ''), pa.scalar(None, pa.string()), field)
+        return pc.cast(field, pa.float64())
+
+    hours = pc.fill_null(_field(0), 0.0)
+    minutes = pc.fill_null(_field(1), 0.0)
+    seconds = _field(2)
+    total = pc.add(pc.add(pc.multiply(hours, 3600.0), pc.multiply(minutes, 60.0)), seconds)
+    result = total.to_numpy(zero_copy_only=False).astype(np.float64, copy=True)
+    # The pattern only knows ASCII decimals; rows it rejects may still be
+    # something float() accepts ("+ 5", "inf", "1_000"), so ask the scalar parser
+    failed = np.isnan(result) & series.notna().to_numpy()
+    if failed.any():
+        result[failed] = [_parse_time_scalar(value) for value in series.to_numpy(dtype=object)[failed]]
+    return pd.Series(result, index=series.index, dtype='float64')
+
+
+# Exact powers of ten. A mantissa of at most _MAX_DIGITS digits is exact in a
+# float64, so mantissa * or / 10**k is a single, correctly rounded operation
+_POW10 = np.array([10.0 ** i for i in range(23)])
+_MAX_DIGITS = 15
+
+
+@njit(cache=True)
+def _parse_number_codepoints(row, start, end):
+    """
+    Parse row[start:end] (unicode code points) as a decimal float.
+
+    Returns:
+        tuple: (value, exact). value is NaN if the text is not a number.
+        exact is False when the text holds something only float() can
+        settle: other characters (e.g. 'inf', '_', non-ASCII digits), more
+        than _MAX_DIGITS significant digits, or a power of ten beyond 1e22.
+    """
+    while start < end and (row[start] == 32 or 9 <= row[start] <= 13):
+        start += 1
+    while end > start and (row[end - 1] == 32 or 9 <= row[end - 1] <= 13):
+        end -= 1
+
+    i = start
+    negative = False
+    if i < end and (row[i] == 43 or row[i] == 45):  # '+' / '-'
+        negative = row[i] == 45
+        i += 1
+
+    mantissa = 0
+    digits = 0
+    significant = 0
+    decimals = 0
+    seen_dot = False
+    while i < end:
+        c = row[i]
+        if 48 <= c <= 57:
+            if significant > 0 or c != 48:
+                significant += 1
+                if significant > _MAX_DIGITS:
+                    return np.nan, False
+            mantissa = mantissa * 10 + (c - 48)
+            digits += 1
+            if seen_dot:
+                decimals += 1
+        elif c == 46 and not seen_dot:  # '.'
+            seen_dot = True
+        else:
+            break
+        i += 1
+
+    exponent = 0
+    if digits > 0 and i < end and (row[i] == 101 or row[i] == 69):  # 'e' / 'E'
+        i += 1
+        exp_negative = False
+        if i < end and (row[i] == 43 or row[i] == 45):
+            exp_negative = row[i] == 45
+            i += 1
+        exp_digits = 0
+        while i < end and 48 <= row[i] <= 57:
+            if exponent < 10000:
+                exponent = exponent * 10 + (row[i] - 48)
+            exp_digits += 1
+            i += 1
+        if exp_digits == 0:
+            digits = 0  # a bare 'e' is invalid, but check what follows it
+        if exp_negative:
+            exponent = -exponent
+    if i != end:
+        # Stray ASCII punctuation or spaces are never part of a number;
+        # anything else may be ('inf', '1_000', non-ASCII digits or spaces)
+        for j in range(i, end):
+            c = row[j]
+            if not (32 <= c <= 126 or 9 <= c <= 13) or c == 95 \
+                    or 65 <= c <= 90 or 97 <= c <= 122:
+                return np.nan, False
+        return np.nan, True
+    if digits == 0:
+        return np.nan, True
+
+    scale = exponent - decimals
+    if mantissa == 0:
+        value = 0.0
+    elif 0 <= scale <= 22:
+        value = mantissa * _POW10[scale]
+    elif -22 <= scale < 0:
+        value = mantissa / _POW10[-scale]
+    else:
+        return np.nan, False
+    return (-value if negative else value), True
+
+
+@njit(cache=True, parallel=True)
+def parse_time_array_numba(codepoints):
+    """
+    Parse time strings to seconds in a single pass per string.
+
+    Args:
+        codepoints (np.ndarray): 2-D uint32 array, one NUL-padded row of
+            unicode code points per string (a '<U' array viewed as uint32).
+
+    Returns:
+        tuple: Float64 seconds, NaN where parsing fails, and a boolean array
+            marking the rows to hand to _parse_time_scalar instead.
+    """
+    n_rows, width = codepoints.shape
+    out = np.empty(n_rows)
+    inexact = np.zeros(n_rows, dtype=np.bool_)
+    for r in prange(n_rows):
+        row = codepoints[r]
+        end = width
+        while end > 0 and row[end - 1] == 0:
+            end -= 1
+        start = 0
+        while start < end and (row[start] == 32 or 9 <= row[start] <= 13):
+            start += 1
+        while end > start and (row[end - 1] == 32 or 9 <= row[end - 1] <= 13):
+            end -= 1
+        if start < end and row[start] == 43:  # Gap format "+SS.sss"
+            start += 1
+
+        # Locate up to two ':' separators
+        first = -1
+        second = -1
+        too_many = False
+        for i in range(start, end):
+            if row[i] == 58:
+                if first < 0:
+                    first = i
+                elif second < 0:
+                    second = i
+                else:
+                    too_many = True
+                    break
+
+        if too_many:
+            out[r] = np.nan
+        elif second >= 0:
+            hours, ok_h = _parse_number_codepoints(row, start, first)
+            minutes, ok_m = _parse_number_codepoints(row, first + 1, second)
+            seconds, ok_s = _parse_number_codepoints(row, second + 1, end)
+            out[r] = hours * 3600 + minutes * 60 + seconds
+            inexact[r] = not (ok_h and ok_m and ok_s)
+        elif first >= 0:
+            minutes, ok_m = _parse_number_codepoints(row, start, first)
+            seconds, ok_s = _parse_number_codepoints(row, first + 1, end)
+            out[r] = minutes * 60 + seconds
+            inexact[r] = not (ok_m and ok_s)
+        else:
+            out[r], ok = _parse_number_codepoints(row, start, end)
+            inexact[r] = not ok
+    return out, inexact
+
+
+def _parse_time_scalar(time_str) -> float:
+    """Parse one time string to seconds; see DataLoader.parse_time_str."""
+    if pd.isna(time_str) or time_str == '':
+        return np.nan
+
+    time_str = str(time_str).strip()
+
+    # Handle "Gap" format like "+1:14.985" or "+5.234"
+    if time_str.startswith('+'):
+        time_str = time_str[1:]
+
+    try:
+        parts = time_str.split(':')
+        if len(parts) == 3: # HH:MM:SS.sss
+            hours = float(parts[0])
+            minutes = float(parts[1])
+            seconds = float(parts[2])
+            return hours * 3600 + minutes * 60 + seconds
+        elif len(parts) == 2: # MM:SS.sss
+            minutes = float(parts[0])
+            seconds = float(parts[1])
+            return minutes * 60 + seconds
+        elif len(parts) == 1: # SS.sss
+            return float(parts[0])
+        else:
+            return np.nan
+    except ValueError:
+        return np.nan
+
+
+def _is_plain_numeric(series: pd.Series) -> bool:
+    """Check whether a series already holds numbers (int or float, not bool)."""
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
+
+# Rows longer than this are parsed in their own batch (see _parse_time_numba)
+_NUMBA_MAX_WIDTH = 64
+
+
+def _parse_time_numba(series: pd.Series) -> pd.Series:
+    """
+    Adapter feeding an object time column to parse_time_array_numba.
+
+    Args:
+        series (pd.Series): Series of time strings (NaN/None allowed).
+
+    Returns:
+        pd.Series: Float64 seconds, NaN where parsing fails.
+    """
+    if len(series) == 0:
+        return pd.Series(np.empty(0), index=series.index, dtype='float64')
+    text = series.where(series.notna(), '').astype(str).to_numpy(dtype=str)
+    if text.dtype.itemsize // 4 <= _NUMBA_MAX_WIDTH:
+        out, inexact = _parse_fixed_width(text)
+    else:
+        # A fixed-width array is as wide as its longest string, so a few long
+        # free-text cells would make the kernel scan padding on every row;
+        # parse the short and long rows as separate, narrower batches
+        long_rows = np.char.str_len(text) > _NUMBA_MAX_WIDTH
+        out = np.empty(len(text))
+        inexact = np.empty(len(text), dtype=bool)
+        out[~long_rows], inexact[~long_rows] = _parse_fixed_width(
+            text[~long_rows].astype(f'<U{_NUMBA_MAX_WIDTH}'))
+        out[long_rows], inexact[long_rows] = _parse_fixed_width(text[long_rows])
+    # Rows the kernel cannot parse exactly go through the scalar parser
+    if inexact.any():
+        out[inexact] = [_parse_time_scalar(value) for value in series.to_numpy()[inexact]]
+    return pd.Series(out, index=series.index)
+
+
+def _parse_fixed_width(text: np.ndarray):
+    """Run parse_time_array_numba over a '<U' string array."""
+    if len(text) == 0:
+        return np.empty(0), np.empty(0, dtype=bool)
+    return parse_time_array_numba(text.view(np.uint32).reshape(len(text), -1))
+
+
 class DataLoader:
     """
     Handles loading and preprocessing of telemetry data from CSV files.
@@ -36,26 +353,63 @@ class DataLoader:
         self.sanitizer = DataSanitizer() if DataSanitizer else None
         self.transformer = DataTransformer() if DataTransformer else None
 
-    def load_csv(self, filepath: str) -> bool:
+    def load_csv(self, filepath: str, cache: bool = False) -> bool:
         """
         Loads telemetry data from a CSV file.
 
         Args:
             filepath (str): The absolute path to the CSV file.
+            cache (bool): Keep the parsed data as an Arrow IPC (Feather) file in
+                a .telemetry_cache directory next to the CSV and memory-map it
+                on later loads of the unchanged file. Requires pyarrow.
 
         Returns:
             bool: True if loading was successful, False otherwise.
         """
         try:
+            cache_path = self._feather_cache_path(filepath) if cache and pa is not None else None
+            if cache_path and os.path.exists(cache_path):
+                self.raw_data = self._arrow_to_pandas(pa_feather.read_table(cache_path, memory_map=True))
+                logger.info("Loaded %d rows from cache for %s", len(self.raw_data), filepath)
+                return True
+
             self.raw_data = pd.read_csv(filepath)
-            print(f"Successfully loaded {len(self.raw_data)} rows from {filepath}")
+            logger.info("Successfully loaded %d rows from %s", len(self.raw_data), filepath)
+            if cache_path:
+                self._write_feather_cache(self.raw_data, cache_path)
             return True
         except Exception as e:
-            print(f"Error loading CSV: {e}")
+            logger.error("Error loading CSV: %s", e)
             return False
+
+    @staticmethod
+    def _feather_cache_path(filepath: str) -> str:
+        """Cache file for a CSV, named after its size and modification time."""
+        stat = os.stat(filepath)
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(filepath)), '.telemetry_cache')
+        name = f"{os.path.basename(filepath)}.{stat.st_mtime_ns}.{stat.st_size}.feather"
+        return os.path.join(cache_dir, name)
+
+    @staticmethod
+    def _write_feather_cache(df: pd.DataFrame, cache_path: str):
+        """Write df to cache_path, replacing stale caches of the same CSV."""
+        cache_dir = os.path.dirname(cache_path)
+        csv_name = os.path.basename(cache_path).rsplit('.', 3)[0]
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            for name in os.listdir(cache_dir):
+                if name.endswith('.feather') and name.rsplit('.', 3)[0] == csv_name:
+                    os.remove(os.path.join(cache_dir, name))
+            # Uncompressed so later reads can memory-map the columns
+            df.to_feather(cache_path, compression='uncompressed')
+        except (OSError, ValueError, pa.ArrowException) as e:
+            # Read-only directory or a frame Arrow cannot store; just skip caching
+            logger.warning("Could not cache %s: %s", cache_path, e)
     
     def smart_load(self, filepath: str, auto_clean: bool = True, 
-                   auto_transform: bool = True) -> Optional[pd.DataFrame]:
+                   auto_transform: bool = True,
+                   low_precision: bool = False,
+                   chunksize: Optional[int] = None) -> Optional[pd.DataFrame]:
         """
         Intelligently load CSV with automatic schema detection and cleaning.
         
@@ -63,6 +417,10 @@ class DataLoader:
             filepath (str): Path to CSV file.
             auto_clean (bool): Automatically clean data.
             auto_transform (bool): Automatically transform data.
+            low_precision (bool): Store float columns and derived features as
+                float32, halving the memory read by cleaning and feature generation.
+            chunksize (Optional[int]): Read the file this many rows at a time,
+                shrinking each chunk before they are combined.
         
         Returns:
             Optional[pd.DataFrame]: Loaded and processed dataframe.
@@ -75,22 +433,24 @@ class DataLoader:
         
         try:
             # Analyze schema first
-            print("Analyzing CSV schema...")
+            logger.info("Analyzing CSV schema...")
             self.schema_analysis = self.schema_analyzer.analyze_file(filepath)
             
-            print(f"Detected {self.schema_analysis.total_columns} columns")
-            print(f"Data quality score: {self.schema_analysis.overall_quality_score:.1f}%")
+            logger.info("Detected %d columns", self.schema_analysis.total_columns)
+            logger.info("Data quality score: %.1f%%", self.schema_analysis.overall_quality_score)
             
             # Load with detected parameters
-            self.raw_data = pd.read_csv(
-                filepath,
-                encoding=self.schema_analysis.encoding,
-                delimiter=self.schema_analysis.delimiter
-            )
+            if chunksize:
+                self.raw_data = self._read_csv_chunked(filepath, self.schema_analysis,
+                                                       chunksize, low_precision)
+            else:
+                self.raw_data = self._read_csv(filepath, self.schema_analysis)
+                if low_precision:
+                    self.raw_data = self._downcast_floats(self.raw_data)
             
             # Apply suggested mappings
             if self.schema_analysis.suggested_mappings:
-                print(f"Applying {len(self.schema_analysis.suggested_mappings)} column mappings")
+                logger.info("Applying %d column mappings", len(self.schema_analysis.suggested_mappings))
                 self.raw_data.rename(columns=self.schema_analysis.suggested_mappings, inplace=True)
             
             # Check for long-format telemetry data and pivot if necessary
@@ -99,35 +459,32 @@ class DataLoader:
             
             # Auto-clean if requested
             if auto_clean and self.sanitizer:
-                print("Cleaning data...")
+                logger.info("Cleaning data...")
                 self.raw_data, sanitization_report = self.sanitizer.clean_data(
                     self.raw_data,
                     impute_missing=True,
                     correct_outliers=True,
                     remove_duplicates=True
                 )
-                print(f"Sanitization: {', '.join(sanitization_report.operations_performed)}")
+                logger.info("Sanitization: %s", ', '.join(sanitization_report.operations_performed))
             
             # Preprocess
             self.clean_data = self.preprocess()
             
             # Auto-transform if requested
             if auto_transform and self.transformer and self.clean_data is not None:
-                print("Generating derived features...")
-                self.clean_data = self.transformer.generate_derived_features(self.clean_data)
+                logger.info("Generating derived features...")
+                self.clean_data = self.transformer.generate_derived_features(
+                    self.clean_data, low_precision=low_precision)
             
             # Display warnings
-            if self.schema_analysis.warnings:
-                print("\nWarnings:")
-                for warning in self.schema_analysis.warnings:
-                    print(f"  ⚠ {warning}")
+            for warning in self.schema_analysis.warnings:
+                logger.warning("%s", warning)
             
             return self.clean_data
             
         except Exception as e:
-            print(f"Error in smart load: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error in smart load: %s", e)
             
             # Fallback to regular load, but try to use detected delimiter if available
             delimiter = ','
@@ -136,15 +493,136 @@ class DataLoader:
                 
             try:
                 self.raw_data = pd.read_csv(filepath, delimiter=delimiter)
-                print(f"Fallback loaded {len(self.raw_data)} rows with delimiter '{delimiter}'")
+                logger.info("Fallback loaded %d rows with delimiter '%s'", len(self.raw_data), delimiter)
                 return self.preprocess()
             except Exception as e2:
-                print(f"Fallback failed: {e2}")
+                logger.error("Fallback failed: %s", e2)
                 # Last resort: default read_csv
                 if self.load_csv(filepath):
                     return self.preprocess()
                 return None
     
+    def _read_csv(self, filepath: str, schema: SchemaAnalysis) -> pd.DataFrame:
+        """
+        Read a CSV file using the detected encoding and delimiter.
+
+        Uses pyarrow's multithreaded CSV reader when available. Columns that
+        the schema sample read as text are pinned to strings so Arrow does
+        not infer time/timestamp types for them; everything else is inferred.
+        Falls back to pd.read_csv if pyarrow is missing or rejects the file,
+        passing the sampled column dtypes so pandas does not re-infer them.
+
+        Args:
+            filepath (str): Path to CSV file.
+            schema (SchemaAnalysis): Schema analysis of the file.
+
+        Returns:
+            pd.DataFrame: The loaded data.
+        """
+        if pa_csv is not None:
+            encoding = schema.encoding
+            if encoding.lower() in ('ascii', 'utf-8', 'utf8'):
+                encoding = 'utf8'
+            column_types = {
+                name: pa.string()
+                for name, info in schema.columns.items()
+                if info.data_type == 'object'
+            }
+            try:
+                table = pa_csv.read_csv(
+                    filepath,
+                    read_options=pa_csv.ReadOptions(
+                        encoding=encoding, block_size=16 << 20, use_threads=True
+                    ),
+                    parse_options=pa_csv.ParseOptions(delimiter=schema.delimiter),
+                    convert_options=pa_csv.ConvertOptions(
+                        column_types=column_types, strings_can_be_null=True
+                    ),
+                )
+                # pandas de-duplicates repeated headers; leave that case to it
+                if len(set(table.column_names)) == len(table.column_names):
+                    return self._arrow_to_pandas(table)
+            except (pa.ArrowInvalid, UnicodeDecodeError) as e:
+                logger.warning("Arrow CSV reader failed (%s); falling back to pandas", e)
+
+        # Reuse the dtypes seen in the schema sample so pandas skips inference
+        try:
+            return pd.read_csv(filepath, encoding=schema.encoding, delimiter=schema.delimiter,
+                               dtype=self._sampled_dtypes(schema), engine='c', low_memory=False)
+        except (ValueError, TypeError):
+            # Rows past the sample did not fit the sampled dtypes
+            return pd.read_csv(filepath, encoding=schema.encoding, delimiter=schema.delimiter)
+
+    def _read_csv_chunked(self, filepath: str, schema: SchemaAnalysis, chunksize: int,
+                          low_precision: bool = False) -> pd.DataFrame:
+        """
+        Read a CSV file a chunk of rows at a time.
+
+        Each chunk is downcast before the next one is parsed, so with
+        low_precision the float64 parse buffers never exist for the whole
+        file at once. Cleaning still runs on the combined frame, so its
+        medians and quartiles are exact.
+
+        Args:
+            filepath (str): Path to CSV file.
+            schema (SchemaAnalysis): Schema analysis of the file.
+            chunksize (int): Rows per chunk.
+            low_precision (bool): Store float columns as float32.
+
+        Returns:
+            pd.DataFrame: The loaded data.
+        """
+        for dtype_map in (self._sampled_dtypes(schema), None):
+            try:
+                with pd.read_csv(filepath, encoding=schema.encoding, delimiter=schema.delimiter,
+                                 dtype=dtype_map, chunksize=chunksize) as reader:
+                    chunks = [self._downcast_floats(chunk) if low_precision else chunk
+                              for chunk in reader]
+                break
+            except (ValueError, TypeError):
+                # Rows past the sample did not fit the sampled dtypes
+                if dtype_map is None:
+                    raise
+        return pd.concat(chunks, ignore_index=True)
+
+    @staticmethod
+    def _sampled_dtypes(schema: SchemaAnalysis) -> Dict[str, str]:
+        """Column dtypes seen in the schema sample that pd.read_csv can be pinned to."""
+        return {
+            name: info.data_type
+            for name, info in schema.columns.items()
+            if info.data_type in ('int64', 'float64', 'bool', 'object')
+        }
+
+    @staticmethod
+    def _downcast_floats(df: pd.DataFrame) -> pd.DataFrame:
+        """Cast float64 columns to float32."""
+        float_cols = df.select_dtypes(include=[np.float64]).columns
+        return df.astype({col: np.float32 for col in float_cols})
+
+    @staticmethod
+    def _arrow_to_pandas(table) -> pd.DataFrame:
+        """Convert an Arrow table to pandas with pd.read_csv's missing-value conventions."""
+        null_cols = [f.name for f in table.schema if pa.types.is_null(f.type)]
+        str_cols = [f.name for f in table.schema if pa.types.is_string(f.type)]
+        df = table.to_pandas(self_destruct=True)
+        # Empty columns are float NaN, and missing text is NaN rather than None
+        if null_cols:
+            df[null_cols] = df[null_cols].astype('float64')
+        if str_cols:
+            df[str_cols] = df[str_cols].where(df[str_cols].notna(), np.nan)
+        return df
+
+    def clear_schema_cache(self):
+        """
+        Forget cached schema analyses so the next smart_load re-scans the file.
+
+        Analyses are keyed on (path, mtime, size), so this is only needed when a
+        file is rewritten without those changing.
+        """
+        if self.schema_analyzer:
+            self.schema_analyzer.clear_cache()
+
     def get_schema_info(self) -> Optional[Dict[str, Any]]:
         """
         Get schema analysis information.
@@ -182,32 +660,29 @@ class DataLoader:
         Returns:
             float: The time in seconds, or np.nan if parsing fails.
         """
-        if pd.isna(time_str) or time_str == '':
-            return np.nan
-        
-        time_str = str(time_str).strip()
-        
-        # Handle "Gap" format like "+1:14.985" or "+5.234"
-        if time_str.startswith('+'):
-            time_str = time_str[1:]
-            
-        try:
-            parts = time_str.split(':')
-            if len(parts) == 3: # HH:MM:SS.sss
-                hours = float(parts[0])
-                minutes = float(parts[1])
-                seconds = float(parts[2])
-                return hours * 3600 + minutes * 60 + seconds
-            elif len(parts) == 2: # MM:SS.sss
-                minutes = float(parts[0])
-                seconds = float(parts[1])
-                return minutes * 60 + seconds
-            elif len(parts) == 1: # SS.sss
-                return float(parts[0])
-            else:
-                return np.nan
-        except ValueError:
-            return np.nan
+        return _parse_time_scalar(time_str)
+
+    def _convert_time_column(self, series: pd.Series) -> pd.Series:
+        """
+        Convert a column of time strings to seconds using the fastest available path.
+
+        Arrow-backed columns use pyarrow.compute, other columns use the Numba
+        kernel when numba is installed, then pyarrow.compute when pyarrow is
+        installed, and parse_time_str as a last resort.
+
+        Args:
+            series (pd.Series): Column of time strings.
+
+        Returns:
+            pd.Series: Time in seconds as float64.
+        """
+        if _is_arrow_string(series):
+            return _parse_time_arrow(series)
+        if _HAS_NUMBA:
+            return _parse_time_numba(series)
+        if pa is not None:
+            return _parse_time_arrow(series)
+        return series.apply(self.parse_time_str)
 
     def preprocess(self) -> Optional[pd.DataFrame]:
         """
@@ -216,33 +691,47 @@ class DataLoader:
         Standardizes column names, converts time columns to seconds,
         and ensures numeric types for key metrics.
 
+        Works on a shallow copy of raw_data: converted columns are replaced
+        rather than written in place, so raw_data keeps its values while
+        unchanged columns share memory with the result.
+
         Returns:
             Optional[pd.DataFrame]: The cleaned dataframe, or None if no data is loaded.
         """
         if self.raw_data is None:
-            print("No data loaded.")
+            logger.warning("No data loaded.")
             return None
 
-        df = self.raw_data.copy()
+        df = self.raw_data.copy(deep=False)
 
         # Standardize column names (strip whitespace, upper case)
-        df.columns = [c.strip().upper() for c in df.columns]
+        df.columns = df.columns.str.strip().str.upper()
 
         # Convert Time Columns
-        time_cols = ['TOTAL_TIME', 'GAP_FIRST', 'FL_TIME', 'DIFF_PREV']
-        for col in time_cols:
-            if col in df.columns:
-                df[f'{col}_SEC'] = df[col].apply(self.parse_time_str)
+        time_cols = [c for c in ['TOTAL_TIME', 'GAP_FIRST', 'FL_TIME', 'DIFF_PREV'] if c in df.columns]
+        if time_cols:
+            # Build all *_SEC columns first and attach them in one assignment.
+            # Columns already read as numbers hold seconds and need no parsing
+            df[[f'{col}_SEC' for col in time_cols]] = pd.concat(
+                [df[col].astype('float64') if _is_plain_numeric(df[col])
+                 else self._convert_time_column(df[col])
+                 for col in time_cols],
+                axis=1
+            )
 
-        # Convert Numeric Columns
-        numeric_cols = ['POSITION', 'NUMBER', 'LAPS', 'FL_KPH']
-        for col in numeric_cols:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+        # Convert Numeric Columns (single block assignment), skipping typed ones
+        numeric_cols = [c for c in ['POSITION', 'NUMBER', 'LAPS', 'FL_KPH']
+                        if c in df.columns and not _is_plain_numeric(df[c])]
+        if numeric_cols:
+            df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors='coerce')
 
         # Categorical Encoding (Example: STATUS)
         if 'STATUS' in df.columns:
-            df['STATUS'] = df['STATUS'].astype(str)
+            status = df['STATUS'].astype(str)
+            # A handful of repeated labels is stored as codes; keep free text as str
+            if status.nunique() <= len(status) // 2:
+                status = status.astype('category')
+            df['STATUS'] = status
 
         self.clean_data = df
         return self.clean_data
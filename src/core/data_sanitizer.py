@@ -5,14 +5,90 @@ This module provides intelligent data sanitization including missing value
 imputation, outlier detection and correction, and data normalization.
 """
 
+import os
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Tuple
-from sklearn.impute import SimpleImputer, KNNImputer
+from sklearn.impute import KNNImputer
 from sklearn.preprocessing import StandardScaler, MinMaxScaler
 from sklearn.ensemble import IsolationForest
 from dataclasses import dataclass
 
+try:
+    from pandas.io.common import dedup_names
+except ImportError:  # pandas < 2.0; clean_data falls back to its own renaming loop
+    dedup_names = None
+
+
+def _numeric_columns(df: pd.DataFrame, columns: Optional[pd.Index] = None) -> pd.Index:
+    """
+    Numeric (non-bool) columns of df, optionally restricted to columns.
+
+    Like df.select_dtypes(include=[np.number]).columns, minus timedeltas,
+    but read from df.dtypes, so no sub-frame is materialized.
+    """
+    dtypes = df.dtypes if columns is None else df.dtypes[columns]
+    is_numeric = [pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+                  for dtype in dtypes]
+    return dtypes.index[is_numeric]
+
+
+def _fast_mode(series: pd.Series) -> Any:
+    """
+    Most frequent non-null value of a series, or NaN if there is none.
+
+    Counts categorical codes with np.bincount instead of Series.mode()'s
+    sort. Ties resolve to the smallest category, as with Series.mode()[0].
+    """
+    cat = pd.Categorical(series)
+    codes = cat.codes[cat.codes >= 0]
+    if len(codes) == 0:
+        return np.nan
+    return cat.categories[np.bincount(codes).argmax()]
+
+
+def _quartiles(values: np.ndarray) -> np.ndarray:
+    """First and third quartile of a 1-D float array, ignoring NaN."""
+    return np.percentile(values[~np.isnan(values)], [25, 75])
+
+
+def _fill_nan_with_median(values: np.ndarray) -> np.ndarray:
+    """Fill NaNs in a 2-D float array in place with their column's median."""
+    missing = np.isnan(values)
+    if missing.any():
+        # All-NaN columns have no median and stay NaN
+        has_data = ~missing.all(axis=0)
+        medians = np.full(values.shape[1], np.nan)
+        medians[has_data] = np.nanmedian(values[:, has_data], axis=0)
+        rows, cols = np.nonzero(missing)
+        values[rows, cols] = medians[cols]
+    return values
+
+
+def _assign_numeric_block(df: pd.DataFrame, columns: pd.Index, values: np.ndarray) -> None:
+    """
+    Write a 2-D float array back to df[columns], keeping each column's dtype.
+
+    Float columns are cast back to their own dtype, so float32 stays float32.
+    Integer columns (including nullable Int64) are cast back while the values
+    are still whole numbers; otherwise they become float64, as pandas does
+    when a fractional value is set into them.
+    """
+    block = pd.DataFrame(values, index=df.index, columns=columns)
+    dtypes = {}
+    for i, (col, dtype) in enumerate(df.dtypes[columns].items()):
+        if dtype == np.float64:
+            continue
+        if pd.api.types.is_integer_dtype(dtype):
+            column = values[:, i]
+            present = column[~np.isnan(column)]
+            if len(present) < len(column) and isinstance(dtype, np.dtype):
+                continue
+            if not np.array_equal(present, np.round(present)):
+                continue
+        dtypes[col] = dtype
+    df[columns] = block.astype(dtypes) if dtypes else block
 
 
 @dataclass
@@ -59,22 +135,26 @@ class DataSanitizer:
         operations = []
         warnings = []
         rows_before = len(df)
+        # Single private copy; the steps below modify it in place
         df_clean = df.copy()
         
         # Ensure unique column names to prevent "truth value ambiguous" errors
         if not df_clean.columns.is_unique:
             warnings.append("Duplicate column names detected and renamed")
-            # Simple deduplication: append .1, .2, etc.
-            new_cols = []
-            seen = {}
-            for col in df_clean.columns:
-                if col in seen:
-                    seen[col] += 1
-                    new_cols.append(f"{col}.{seen[col]}")
-                else:
-                    seen[col] = 0
-                    new_cols.append(col)
-            df_clean.columns = new_cols
+            # Append .1, .2, etc. the way pd.read_csv does
+            if dedup_names is not None:
+                df_clean.columns = dedup_names(df_clean.columns, is_potential_multiindex=False)
+            else:
+                new_cols = []
+                seen = {}
+                for col in df_clean.columns:
+                    if col in seen:
+                        seen[col] += 1
+                        new_cols.append(f"{col}.{seen[col]}")
+                    else:
+                        seen[col] = 0
+                        new_cols.append(col)
+                df_clean.columns = new_cols
         
         missing_imputed = 0
         outliers_detected = 0
@@ -89,17 +169,20 @@ class DataSanitizer:
                 duplicates_removed = duplicates_before
                 operations.append(f"Removed {duplicates_removed} duplicate rows")
         
+        # Count missing values once; later steps reuse the per-column counts
+        na_counts = df_clean.isna().sum()
+        
         # Impute missing values
         if impute_missing:
-            missing_before = df_clean.isna().sum().sum()
+            missing_before = na_counts.sum()
             if missing_before > 0:
-                df_clean, imputed_count = self._impute_missing_values(df_clean)
+                df_clean, imputed_count = self._impute_missing_values(df_clean, na_counts)
                 missing_imputed = imputed_count
                 operations.append(f"Imputed {missing_imputed} missing values")
         
         # Correct outliers
         if correct_outliers:
-            df_clean, outlier_stats = self._correct_outliers(df_clean)
+            df_clean, outlier_stats = self._correct_outliers(df_clean, na_counts)
             outliers_detected = outlier_stats['detected']
             outliers_corrected = outlier_stats['corrected']
             if outliers_detected > 0:
@@ -134,122 +217,141 @@ class DataSanitizer:
         self.report = report
         return df_clean, report
     
-    def _impute_missing_values(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
+    def _impute_missing_values(self, df: pd.DataFrame, na_counts: Optional[pd.Series] = None,
+                               copy: bool = False) -> Tuple[pd.DataFrame, int]:
         """
         Intelligently impute missing values.
         
         Args:
-            df (pd.DataFrame): Input dataframe.
+            df (pd.DataFrame): Input dataframe, modified in place unless copy is set.
+            na_counts (Optional[pd.Series]): Precomputed df.isna().sum().
+            copy (bool): Work on a copy of df instead.
         
         Returns:
             Tuple[pd.DataFrame, int]: Cleaned dataframe and count of imputed values.
         """
-        df_imputed = df.copy()
-        imputed_count = 0
-        
-        for col in df_imputed.columns:
-            missing_count = df_imputed[col].isna().sum()
-            if missing_count == 0:
-                continue
-            
-            # Numeric columns - use median or KNN
-            if pd.api.types.is_numeric_dtype(df_imputed[col]):
-                missing_ratio = missing_count / len(df_imputed)
-                
-                if missing_ratio < 0.3:
-                    # Use median for low missing ratios
-                    median_val = df_imputed[col].median()
-                    df_imputed[col].fillna(median_val, inplace=True)
-                else:
-                    # Use forward fill for time series data
-                    df_imputed[col].fillna(method='ffill', inplace=True)
-                    df_imputed[col].fillna(method='bfill', inplace=True)
-                
-                imputed_count += missing_count
-            
-            # Categorical columns - use mode or forward fill
-            else:
-                # Try mode first
-                if df_imputed[col].mode().shape[0] > 0:
-                    mode_val = df_imputed[col].mode()[0]
-                    df_imputed[col].fillna(mode_val, inplace=True)
-                else:
-                    # Use forward fill
-                    df_imputed[col].fillna(method='ffill', inplace=True)
-                    df_imputed[col].fillna(method='bfill', inplace=True)
-                
-                imputed_count += missing_count
+        df_imputed = df.copy() if copy else df
+        
+        if na_counts is None:
+            na_counts = df_imputed.isna().sum()
+        missing = na_counts[na_counts > 0]
+        if missing.empty:
+            return df_imputed, 0
+        imputed_count = missing.sum()
+        
+        # Partition the columns with gaps once, then fill each group in bulk
+        missing_ratio = missing / len(df_imputed)
+        numeric_cols = _numeric_columns(df_imputed, missing.index)
+        other_cols = missing.index.difference(numeric_cols, sort=False)
+        
+        # Numeric columns - median for low missing ratios
+        median_cols = numeric_cols[missing_ratio[numeric_cols] < 0.3]
+        if len(median_cols) > 0:
+            values = df_imputed[median_cols].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+            _assign_numeric_block(df_imputed, median_cols, _fill_nan_with_median(values))
+        
+        # Numeric columns - forward/backward fill for time series data
+        fill_cols = numeric_cols[missing_ratio[numeric_cols] >= 0.3]
+        if len(fill_cols) > 0:
+            df_imputed[fill_cols] = df_imputed[fill_cols].ffill().bfill()
+        
+        # Categorical columns - use mode (all-NaN columns have none and stay as is)
+        if len(other_cols) > 0:
+            modes = {col: _fast_mode(df_imputed[col]) for col in other_cols}
+            df_imputed[other_cols] = df_imputed[other_cols].fillna(modes)
         
         return df_imputed, imputed_count
     
-    def _correct_outliers(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    def _correct_outliers(self, df: pd.DataFrame, na_counts: Optional[pd.Series] = None,
+                          copy: bool = False) -> Tuple[pd.DataFrame, Dict[str, int]]:
         """
         Detect and correct outliers using statistical methods.
         
         Args:
-            df (pd.DataFrame): Input dataframe.
+            df (pd.DataFrame): Input dataframe, modified in place unless copy is set.
+            na_counts (Optional[pd.Series]): Precomputed df.isna().sum(). Counts
+                taken before imputation still identify the all-NaN columns.
+            copy (bool): Work on a copy of df instead.
         
         Returns:
             Tuple[pd.DataFrame, Dict]: Cleaned dataframe and outlier statistics.
         """
-        df_corrected = df.copy()
+        df_corrected = df.copy() if copy else df
         total_detected = 0
         total_corrected = 0
         
-        # Get numeric columns
-        numeric_cols = df_corrected.select_dtypes(include=[np.number]).columns
+        # Get numeric columns (all-NaN columns have no bounds and are skipped)
+        numeric_cols = _numeric_columns(df_corrected)
+        if na_counts is None:
+            na_counts = df_corrected[numeric_cols].isna().sum()
+        numeric_cols = numeric_cols[(na_counts[numeric_cols] < len(df_corrected)).to_numpy()]
+        if len(numeric_cols) == 0:
+            return df_corrected, {'detected': 0, 'corrected': 0}
+        
+        # Materialize the numeric block once. Column-major order keeps each
+        # column contiguous (and is a zero-copy view of a single float block)
+        values = np.asfortranarray(df_corrected[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan))
+        
+        # Use IQR method for outlier detection. Columns are independent and
+        # NumPy's partition releases the GIL, so quartiles run on a thread pool
+        columns = [values[:, i] for i in range(values.shape[1])]
+        workers = min(len(columns), os.cpu_count() or 1)
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                q = np.column_stack(list(executor.map(_quartiles, columns)))
+        else:
+            q = np.column_stack([_quartiles(values) for values in columns])
+        iqr = q[1] - q[0]
+        lower_bound = q[0] - 1.5 * iqr
+        upper_bound = q[1] + 1.5 * iqr
         
-        for col in numeric_cols:
-            if df_corrected[col].isna().all():
-                continue
-            
-            # Use IQR method for outlier detection
-            Q1 = df_corrected[col].quantile(0.25)
-            Q3 = df_corrected[col].quantile(0.75)
-            IQR = Q3 - Q1
-            
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            
-            # Detect outliers
-            outliers = (df_corrected[col] < lower_bound) | (df_corrected[col] > upper_bound)
-            outlier_count = outliers.sum()
-            
-            if outlier_count > 0:
-                total_detected += outlier_count
-                
-                # Correct outliers by capping at bounds
-                df_corrected.loc[df_corrected[col] < lower_bound, col] = lower_bound
-                df_corrected.loc[df_corrected[col] > upper_bound, col] = upper_bound
-                total_corrected += outlier_count
+        # Detect outliers
+        outliers = (values < lower_bound) | (values > upper_bound)
+        outlier_counts = outliers.sum(axis=0)
+        total_detected = int(outlier_counts.sum())
+        
+        # Correct outliers by capping at bounds, in each column's own dtype
+        capped_cols = numeric_cols[outlier_counts > 0]
+        if len(capped_cols) > 0:
+            mask = outlier_counts > 0
+            capped = np.clip(values[:, mask], lower_bound[mask], upper_bound[mask])
+            _assign_numeric_block(df_corrected, capped_cols, capped)
+            total_corrected = total_detected
         
         return df_corrected, {'detected': total_detected, 'corrected': total_corrected}
     
-    def _normalize_data(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _normalize_data(self, df: pd.DataFrame, copy: bool = False) -> pd.DataFrame:
         """
         Normalize numeric columns.
         
         Args:
-            df (pd.DataFrame): Input dataframe.
+            df (pd.DataFrame): Input dataframe, modified in place unless copy is set.
+            copy (bool): Work on a copy of df instead.
         
         Returns:
             pd.DataFrame: Normalized dataframe.
         """
-        df_normalized = df.copy()
+        df_normalized = df.copy() if copy else df
         
         # Get numeric columns
-        numeric_cols = df_normalized.select_dtypes(include=[np.number]).columns
-        
-        # Use StandardScaler for normalization
-        scaler = StandardScaler()
-        
-        for col in numeric_cols:
-            if df_normalized[col].isna().all():
-                continue
-            
-            # Normalize
-            values = df_normalized[col].values.reshape(-1, 1)
-            df_normalized[col] = scaler.fit_transform(values)
+        numeric_cols = _numeric_columns(df_normalized)
+        
+        # Skip all-NaN columns, the scaler has nothing to fit on
+        valid_cols = numeric_cols[df_normalized[numeric_cols].notna().any().to_numpy()]
+        if len(valid_cols) == 0:
+            return df_normalized
+        
+        # Use StandardScaler for normalization, fitted over the whole block.
+        # float32 columns come out as float32 and all others as float64, as
+        # when each column was scaled on its own
+        is_float32 = (df_normalized.dtypes[valid_cols] == np.float32).to_numpy()
+        block_dtype = np.float32 if is_float32.all() else np.float64
+        values = df_normalized[valid_cols].to_numpy(dtype=block_dtype, na_value=np.nan)
+        scaled = pd.DataFrame(StandardScaler().fit_transform(values),
+                              index=df_normalized.index, columns=valid_cols)
+        if is_float32.any() and block_dtype == np.float64:
+            scaled = scaled.astype(dict.fromkeys(valid_cols[is_float32], np.float32))
+        df_normalized[valid_cols] = scaled
         
         return df_normalized
 
@@ -280,8 +382,8 @@ class SmartImputer:
             pd.DataFrame: Imputed dataframe.
         """
         # Separate numeric and non-numeric columns
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        non_numeric_cols = df.select_dtypes(exclude=[np.number]).columns
+        numeric_cols = _numeric_columns(df)
+        non_numeric_cols = df.columns.difference(numeric_cols, sort=False)
         
         df_imputed = df.copy()
         
@@ -289,16 +391,19 @@ class SmartImputer:
         if len(numeric_cols) > 0:
             if self.strategy == 'knn':
                 self.imputer = KNNImputer(n_neighbors=5)
+                values = self.imputer.fit_transform(df[numeric_cols])
             else:
-                self.imputer = SimpleImputer(strategy='median')
-            
-            df_imputed[numeric_cols] = self.imputer.fit_transform(df[numeric_cols])
-        
-        # Impute non-numeric columns with mode
-        for col in non_numeric_cols:
-            if df_imputed[col].isna().any():
-                mode_val = df_imputed[col].mode()[0] if len(df_imputed[col].mode()) > 0 else 'Unknown'
-                df_imputed[col].fillna(mode_val, inplace=True)
+                # Median fill straight in NumPy, without SimpleImputer's validation copies
+                values = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+                values = _fill_nan_with_median(values)
+            _assign_numeric_block(df_imputed, numeric_cols, values)
+        
+        # Impute non-numeric columns with mode, in one fill over the columns with gaps
+        gap_cols = non_numeric_cols[df_imputed[non_numeric_cols].isna().any().to_numpy()]
+        if len(gap_cols) > 0:
+            modes = {col: _fast_mode(df_imputed[col]) for col in gap_cols}
+            modes = {col: 'Unknown' if pd.isna(val) else val for col, val in modes.items()}
+            df_imputed[gap_cols] = df_imputed[gap_cols].fillna(modes)
         
         return df_imputed
 
@@ -308,6 +413,9 @@ class OutlierDetector:
     Advanced outlier detection using Isolation Forest.
     """
     
+    # Isolation Forest works from subsamples; larger inputs are fitted on this many rows
+    MAX_FIT_ROWS = 2 ** 15
+    
     def __init__(self, contamination: float = 0.1):
         """
         Initialize the detector.
@@ -316,29 +424,40 @@ class OutlierDetector:
             contamination (float): Expected proportion of outliers.
         """
         self.contamination = contamination
-        self.model = IsolationForest(contamination=contamination, random_state=42)
+        self.model = IsolationForest(contamination=contamination, random_state=42, n_jobs=-1)
+        self._fitted_columns = None
     
-    def detect(self, df: pd.DataFrame) -> np.ndarray:
+    def detect(self, df: pd.DataFrame, refit: bool = True) -> np.ndarray:
         """
         Detect outliers in dataframe.
         
         Args:
             df (pd.DataFrame): Input dataframe.
+            refit (bool): Fit a new model. If False, reuse the model from the
+                previous call when it was fitted on the same numeric columns.
         
         Returns:
             np.ndarray: Boolean array indicating outliers.
         """
         # Get numeric columns
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        numeric_cols = _numeric_columns(df)
         
         if len(numeric_cols) == 0:
             return np.zeros(len(df), dtype=bool)
         
         # Prepare data
-        X = df[numeric_cols].fillna(df[numeric_cols].median())
-        
-        # Detect outliers
-        predictions = self.model.fit_predict(X)
+        X = df[numeric_cols].fillna(df[numeric_cols].median()).to_numpy()
+        
+        # Fit on a row subsample for large inputs, then score every row
+        if refit or self._fitted_columns != list(numeric_cols):
+            X_fit = X
+            if len(X) > self.MAX_FIT_ROWS:
+                rng = np.random.default_rng(42)
+                X_fit = X[rng.choice(len(X), self.MAX_FIT_ROWS, replace=False)]
+            self.model.fit(X_fit)
+            self._fitted_columns = list(numeric_cols)
+        
+        predictions = self.model.predict(X)
         
         # -1 indicates outlier, 1 indicates inlier
         return predictions == -1
@@ -8,8 +8,168 @@ engineering, and intelligent data transformation capabilities.
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
+import os
 import re
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:  # numba is optional; rolling features fall back to pandas
+    _HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
+
+logger = logging.getLogger(__name__)
+
+# Characters stripped from normalized column names
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s]')
+
+
+@njit(cache=True, parallel=True)
+def rolling_mean_std_3(values, out_mean, out_std, out_cumsum=None):
+    """
+    Fused 3-row rolling mean and sample std, like pandas rolling(3, min_periods=1).
+
+    NaNs are skipped inside each window; the mean needs one valid value and
+    the std two, otherwise the result is NaN. The running cumulative sum can
+    be produced in the same sweep, NaN where the input is NaN like cumsum().
+
+    Args:
+        values (np.ndarray): 2-D float64 array (rows, columns).
+        out_mean (np.ndarray): Output array of the same shape for the means.
+        out_std (np.ndarray): Output array of the same shape for the stds.
+        out_cumsum (Optional[np.ndarray]): Output array for the cumulative sums.
+    """
+    n_rows, n_cols = values.shape
+    for c in prange(n_cols):
+        running = 0.0
+        for r in range(n_rows):
+            if out_cumsum is not None:
+                x = values[r, c]
+                if np.isnan(x):
+                    out_cumsum[r, c] = np.nan
+                else:
+                    running += x
+                    out_cumsum[r, c] = running
+            total = 0.0
+            count = 0
+            first = np.nan
+            constant = True
+            for i in range(max(0, r - 2), r + 1):
+                x = values[i, c]
+                if not np.isnan(x):
+                    if count == 0:
+                        first = x
+                    elif x != first:
+                        constant = False
+                    total += x
+                    count += 1
+            if count == 0:
+                out_mean[r, c] = np.nan
+                out_std[r, c] = np.nan
+                continue
+            mean = total / count
+            out_mean[r, c] = mean
+            if count < 2:
+                out_std[r, c] = np.nan
+                continue
+            if constant:
+                # Exactly 0 for repeated values, as pandas reports
+                out_std[r, c] = 0.0
+                continue
+            squares = 0.0
+            for i in range(max(0, r - 2), r + 1):
+                x = values[i, c]
+                if not np.isnan(x):
+                    squares += (x - mean) * (x - mean)
+            out_std[r, c] = np.sqrt(squares / (count - 1))
+
+
+def _rolling_stats_3(series: pd.Series) -> Tuple[pd.Series, pd.Series, pd.Series]:
+    """Pandas equivalent of rolling_mean_std_3 for one column: MA3, STD3, cumsum."""
+    rolling = series.rolling(window=3, min_periods=1)
+    return rolling.mean(), rolling.std(), series.cumsum()
+
+
+def _column_major(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return df with each column contiguous in memory.
+
+    Frames built from a row-major 2-D array keep it as their block, so every
+    per-column kernel (rolling, cumsum, diff) strides across rows. Such
+    single-dtype frames are copied once into column-major order; anything
+    else (including extension dtypes such as Int64) is returned unchanged.
+    """
+    if df.shape[1] < 2 or df.dtypes.nunique() != 1 or not isinstance(df.dtypes.iloc[0], np.dtype):
+        return df
+    values = df.to_numpy()  # zero-copy view of the single block
+    if values.flags.f_contiguous or not values.flags.c_contiguous:
+        return df
+    return pd.DataFrame(np.asfortranarray(values), index=df.index, columns=df.columns)
+
+
+def _first_match_re(alternatives: List[Tuple[str, str]]) -> re.Pattern:
+    """
+    Compile alternatives into one regex whose ``lastgroup`` names the first
+    alternative (in list order, not string position) found anywhere in the text.
+    """
+    branches = '|'.join(f'(?=.*?(?:{pattern}))(?P<{name}>)' for name, pattern in alternatives)
+    return re.compile(f'^(?:{branches})', re.S)
+
+
+# Quantity keywords, checked in priority order
+_QUANTITY_RE = _first_match_re([('speed', 'speed|velocity'), ('distance', 'dist'), ('temperature', 'temp')])
+
+# Per quantity: unit regex, {group: (unit, confidence)}, quantity to infer from data
+_UNIT_RULES = {
+    'speed': (
+        _first_match_re([('kmh', 'kph|km/h|kmh'), ('mph', 'mph'), ('ms', 'm/s|ms')]),
+        {'kmh': ('km/h', 0.95), 'mph': ('mph', 0.95), 'ms': ('m/s', 0.90)},
+        'speed',
+    ),
+    'distance': (
+        _first_match_re([('km', 'km'), ('miles', 'mile'), ('m', 'm')]),
+        {'km': ('km', 0.95), 'miles': ('miles', 0.95), 'm': ('m', 0.90)},
+        None,
+    ),
+    'temperature': (
+        _first_match_re([('C', 'c'), ('F', 'f'), ('K', 'k')]),
+        {'C': ('C', 0.95), 'F': ('F', 0.95), 'K': ('K', 0.90)},
+        'temperature',
+    ),
+}
+
+
+@lru_cache(maxsize=1024)
+def _unit_from_name(col_lower: str) -> Tuple[str, float, bool, Optional[str]]:
+    """
+    Detect a unit from a lower-cased column name alone.
+    
+    Returns:
+        Tuple[str, float, bool, Optional[str]]: Unit, confidence, whether a
+            conversion is available, and 'speed'/'temperature' when the name
+            only names the quantity and the unit must be inferred from data.
+    """
+    quantity = _QUANTITY_RE.match(col_lower)
+    if quantity is None:
+        return 'unknown', 0.0, False, None
+    
+    unit_re, units, infer_from = _UNIT_RULES[quantity.lastgroup]
+    unit = unit_re.match(col_lower)
+    if unit is None:
+        return 'unknown', 0.3, False, infer_from
+    
+    detected, confidence = units[unit.lastgroup]
+    return detected, confidence, True, None
 
 
 @dataclass
@@ -69,73 +229,40 @@ class UnitConverter:
         Returns:
             UnitInfo: Detected unit information.
         """
-        col_lower = column_name.lower()
-        
-        # Speed units
-        if any(keyword in col_lower for keyword in ['speed', 'velocity']):
-            if 'kph' in col_lower or 'km/h' in col_lower or 'kmh' in col_lower:
-                return UnitInfo(column_name, 'km/h', 0.95, True)
-            elif 'mph' in col_lower:
-                return UnitInfo(column_name, 'mph', 0.95, True)
-            elif 'm/s' in col_lower or 'ms' in col_lower:
-                return UnitInfo(column_name, 'm/s', 0.90, True)
-            else:
-                # Infer from data range
-                median_val = series.median()
-                if 0 < median_val < 50:
-                    return UnitInfo(column_name, 'm/s', 0.6, True)
-                elif 50 < median_val < 200:
-                    return UnitInfo(column_name, 'km/h', 0.7, True)
-                else:
-                    return UnitInfo(column_name, 'unknown', 0.3, False)
-        
-        # Distance units
-        if any(keyword in col_lower for keyword in ['distance', 'dist']):
-            if 'km' in col_lower:
-                return UnitInfo(column_name, 'km', 0.95, True)
-            elif 'mile' in col_lower:
-                return UnitInfo(column_name, 'miles', 0.95, True)
-            elif 'm' in col_lower or 'meter' in col_lower:
-                return UnitInfo(column_name, 'm', 0.90, True)
-            else:
-                return UnitInfo(column_name, 'unknown', 0.3, False)
-        
-        # Temperature units
-        if any(keyword in col_lower for keyword in ['temp', 'temperature']):
-            if 'c' in col_lower or 'celsius' in col_lower:
-                return UnitInfo(column_name, 'C', 0.95, True)
-            elif 'f' in col_lower or 'fahrenheit' in col_lower:
-                return UnitInfo(column_name, 'F', 0.95, True)
-            elif 'k' in col_lower or 'kelvin' in col_lower:
-                return UnitInfo(column_name, 'K', 0.90, True)
-            else:
-                # Infer from data range
-                median_val = series.median()
-                if 200 < median_val < 400:
-                    return UnitInfo(column_name, 'K', 0.6, True)
-                elif -50 < median_val < 150:
-                    return UnitInfo(column_name, 'C', 0.7, True)
-                else:
-                    return UnitInfo(column_name, 'unknown', 0.3, False)
-        
-        return UnitInfo(column_name, 'unknown', 0.0, False)
+        unit, confidence, available, infer_from = _unit_from_name(column_name.lower())
+        if infer_from is None:
+            return UnitInfo(column_name, unit, confidence, available)
+        
+        # The name gives the quantity but not the unit: infer from data range
+        median_val = series.median()
+        if infer_from == 'speed':
+            if 0 < median_val < 50:
+                return UnitInfo(column_name, 'm/s', 0.6, True)
+            elif 50 < median_val < 200:
+                return UnitInfo(column_name, 'km/h', 0.7, True)
+        else:
+            if 200 < median_val < 400:
+                return UnitInfo(column_name, 'K', 0.6, True)
+            elif -50 < median_val < 150:
+                return UnitInfo(column_name, 'C', 0.7, True)
+        return UnitInfo(column_name, 'unknown', 0.3, False)
     
     def convert_speed(self, value: float, from_unit: str, to_unit: str) -> float:
-        """Convert speed between units."""
+        """Convert speed between units; value may be a scalar or a NumPy array."""
         key = (from_unit, to_unit)
         if key in self.SPEED_CONVERSIONS:
             return value * self.SPEED_CONVERSIONS[key]
         return value
     
     def convert_distance(self, value: float, from_unit: str, to_unit: str) -> float:
-        """Convert distance between units."""
+        """Convert distance between units; value may be a scalar or a NumPy array."""
         key = (from_unit, to_unit)
         if key in self.DISTANCE_CONVERSIONS:
             return value * self.DISTANCE_CONVERSIONS[key]
         return value
     
     def convert_temperature(self, value: float, from_unit: str, to_unit: str) -> float:
-        """Convert temperature between units."""
+        """Convert temperature between units; value may be a scalar or a NumPy array."""
         key = (from_unit, to_unit)
         if key in self.TEMPERATURE_CONVERSIONS:
             converter = self.TEMPERATURE_CONVERSIONS[key]
@@ -148,11 +275,22 @@ class UnitConverter:
 class DataTransformer:
     """
     Intelligent data transformation and feature engineering.
+    
+    Methods return shallow copies: new and replaced columns never touch the
+    input frame, but untouched columns share memory with it, so results
+    should not be modified in place through ``.values``/``.to_numpy()``.
     """
     
-    def __init__(self):
-        """Initialize the transformer."""
+    def __init__(self, low_precision: bool = False):
+        """
+        Initialize the transformer.
+        
+        Args:
+            low_precision (bool): Store derived columns as float32 and small
+                integer fields as int8, halving the memory later passes read.
+        """
         self.unit_converter = UnitConverter()
+        self.low_precision = low_precision
     
     def detect_and_convert_units(self, df: pd.DataFrame, 
                                  target_units: Optional[Dict[str, str]] = None) -> pd.DataFrame:
@@ -167,11 +305,13 @@ class DataTransformer:
         Returns:
             pd.DataFrame: Dataframe with converted units.
         """
-        df_converted = df.copy()
+        df_converted = df.copy(deep=False)
         
         if target_units is None:
             target_units = {'speed': 'km/h', 'distance': 'km', 'temperature': 'C'}
         
+        # Plan all conversions first: (column, from unit, to unit, new name)
+        plan = []
         for col in df_converted.columns:
             if not pd.api.types.is_numeric_dtype(df_converted[col]):
                 continue
@@ -183,63 +323,103 @@ class DataTransformer:
                 continue
             
             # Determine target unit
+            col_lower = col.lower()
             target_unit = None
-            if 'speed' in col.lower() and 'speed' in target_units:
+            if 'speed' in col_lower and 'speed' in target_units:
                 target_unit = target_units['speed']
-            elif 'distance' in col.lower() and 'distance' in target_units:
+            elif 'distance' in col_lower and 'distance' in target_units:
                 target_unit = target_units['distance']
-            elif 'temp' in col.lower() and 'temperature' in target_units:
+            elif 'temp' in col_lower and 'temperature' in target_units:
                 target_unit = target_units['temperature']
             
-            if target_unit and target_unit != unit_info.detected_unit:
-                # Perform conversion
-                if 'speed' in col.lower():
-                    df_converted[col] = df_converted[col].apply(
-                        lambda x: self.unit_converter.convert_speed(x, unit_info.detected_unit, target_unit)
-                        if pd.notna(x) else x
-                    )
-                    # Update column name
-                    new_col_name = col.replace(unit_info.detected_unit, target_unit)
-                    df_converted.rename(columns={col: new_col_name}, inplace=True)
+            # Convert if needed (currently speed only)
+            if target_unit and target_unit != unit_info.detected_unit and 'speed' in col_lower:
+                new_col_name = col.replace(unit_info.detected_unit, target_unit)
+                plan.append((col, unit_info.detected_unit, target_unit, new_col_name))
+        
+        # Conversions are linear, so scale whole columns at once (NaN stays NaN)
+        for col, from_unit, to_unit, _ in plan:
+            values = df_converted[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            df_converted[col] = self.unit_converter.convert_speed(values, from_unit, to_unit)
+        
+        # Update column names in a single rename
+        renames = {col: new_col_name for col, _, _, new_col_name in plan if new_col_name != col}
+        if renames:
+            df_converted = df_converted.rename(columns=renames)
         
         return df_converted
     
-    def generate_derived_features(self, df: pd.DataFrame) -> pd.DataFrame:
+    def generate_derived_features(self, df: pd.DataFrame,
+                                  low_precision: Optional[bool] = None) -> pd.DataFrame:
         """
         Generate derived features from existing data.
         
         Args:
             df (pd.DataFrame): Input dataframe.
+            low_precision (Optional[bool]): Store the derived columns as float32.
+                Defaults to the transformer's low_precision setting.
         
         Returns:
             pd.DataFrame: Dataframe with derived features.
         """
-        df_derived = df.copy()
+        # Lower-case each numeric column name once for all the keyword checks
+        numeric_lower = {col: str(col).lower() for col in df.columns
+                         if pd.api.types.is_numeric_dtype(df[col])}
+        
+        def numeric_matching(*keys):
+            return [col for col, lower in numeric_lower.items() if all(key in lower for key in keys)]
+        
+        lap_time_cols = numeric_matching('lap', 'time')
+        speed_cols = numeric_matching('speed')
+        gap_cols = numeric_matching('gap')
+        
+        # Take every diff in one pass over the block; columns can match several
+        # patterns, so each is listed once
+        delta_cols = list(dict.fromkeys(
+            lap_time_cols + speed_cols + gap_cols + (['POSITION'] if 'POSITION' in df.columns else [])
+        ))
+        deltas = df[delta_cols].diff() if delta_cols else None
+        
+        # Collect every derived column first and attach them in one concat
+        new_cols = {}
         
         # Lap time delta (if lap time column exists)
-        lap_time_cols = [col for col in df_derived.columns if 'lap' in col.lower() and 'time' in col.lower()]
-        for col in lap_time_cols:
-            if pd.api.types.is_numeric_dtype(df_derived[col]):
-                df_derived[f'{col}_DELTA'] = df_derived[col].diff()
-                df_derived[f'{col}_ROLLING_AVG'] = df_derived[col].rolling(window=3, min_periods=1).mean()
+        if lap_time_cols:
+            rolling_avg = df[lap_time_cols].rolling(window=3, min_periods=1).mean()
+            for col in lap_time_cols:
+                new_cols[f'{col}_DELTA'] = deltas[col].to_numpy()
+                new_cols[f'{col}_ROLLING_AVG'] = rolling_avg[col].to_numpy()
         
         # Speed delta
-        speed_cols = [col for col in df_derived.columns if 'speed' in col.lower()]
         for col in speed_cols:
-            if pd.api.types.is_numeric_dtype(df_derived[col]):
-                df_derived[f'{col}_DELTA'] = df_derived[col].diff()
+            new_cols[f'{col}_DELTA'] = deltas[col].to_numpy()
         
         # Position changes
-        if 'POSITION' in df_derived.columns:
-            df_derived['POSITION_CHANGE'] = -df_derived['POSITION'].diff()  # Negative because lower position is better
-            df_derived['POSITION_GAINED'] = df_derived['POSITION_CHANGE'].apply(lambda x: max(0, x) if pd.notna(x) else 0)
-            df_derived['POSITION_LOST'] = df_derived['POSITION_CHANGE'].apply(lambda x: max(0, -x) if pd.notna(x) else 0)
+        if 'POSITION' in df.columns:
+            new_cols['POSITION_CHANGE'] = -deltas['POSITION'].to_numpy()  # Negative because lower position is better
+            change = new_cols['POSITION_CHANGE'].astype(np.float64)
+            # NaN compares False, so the first row counts as no change
+            new_cols['POSITION_GAINED'] = np.where(change > 0, change, 0.0)
+            new_cols['POSITION_LOST'] = np.where(change < 0, -change, 0.0)
         
         # Gap analysis
-        gap_cols = [col for col in df_derived.columns if 'gap' in col.lower()]
         for col in gap_cols:
-            if pd.api.types.is_numeric_dtype(df_derived[col]):
-                df_derived[f'{col}_TREND'] = df_derived[col].diff()  # Positive = gap increasing
+            new_cols[f'{col}_TREND'] = deltas[col].to_numpy()  # Positive = gap increasing
+        
+        if low_precision is None:
+            low_precision = self.low_precision
+        if low_precision:
+            new_cols = {name: values.astype(np.float32) for name, values in new_cols.items()}
+        
+        # Names that already exist are overwritten in place, as before
+        existing = [name for name in new_cols if name in df.columns]
+        df_derived = df.copy(deep=False)
+        for name in existing:
+            df_derived[name] = new_cols.pop(name)
+        if new_cols:
+            df_derived = pd.concat(
+                [df_derived, pd.DataFrame(new_cols, index=df.index)], axis=1, copy=False
+            )
         
         return df_derived
     
@@ -253,32 +433,70 @@ class DataTransformer:
         Returns:
             pd.DataFrame: Dataframe with engineered features.
         """
-        df_engineered = df.copy()
+        df_engineered = df.copy(deep=False)
+        
+        # Group on integer codes rather than re-hashing driver name strings
+        if 'DRIVER' in df_engineered.columns and df_engineered['DRIVER'].dtype == object:
+            df_engineered['DRIVER'] = df_engineered['DRIVER'].astype('category')
         
         # Rolling statistics for numeric columns
         numeric_cols = df_engineered.select_dtypes(include=[np.number]).columns
         
-        for col in numeric_cols:
-            # Skip if column has too many missing values
-            if df_engineered[col].isna().sum() > len(df_engineered) * 0.5:
-                continue
-            
-            # Rolling mean (3-period window)
-            df_engineered[f'{col}_MA3'] = df_engineered[col].rolling(window=3, min_periods=1).mean()
+        # Skip columns with too many missing values
+        numeric = df_engineered[numeric_cols]
+        numeric = _column_major(numeric.loc[:, numeric.isna().sum() <= len(df_engineered) * 0.5])
+        
+        if len(numeric.columns) > 0:
+            # Rolling mean and standard deviation (3-period window)
+            if _HAS_NUMBA:
+                # One fused pass over a column-major copy of the block
+                values = np.asfortranarray(numeric.to_numpy(dtype=np.float64, na_value=np.nan))
+                mean, std, cumsum = np.empty_like(values), np.empty_like(values), np.empty_like(values)
+                rolling_mean_std_3(values, mean, std, cumsum)
+                rolling_mean = pd.DataFrame(mean, index=numeric.index, columns=numeric.columns)
+                rolling_std = pd.DataFrame(std, index=numeric.index, columns=numeric.columns)
+                # Integer columns keep integer sums, as cumsum() returns
+                cumulative = pd.DataFrame(cumsum, index=numeric.index, columns=numeric.columns)
+                cumulative = cumulative.astype(numeric.dtypes.to_dict())
+            else:
+                # Columns are independent and pandas' window kernels release
+                # the GIL, so they run on a thread pool
+                columns = [numeric[col] for col in numeric.columns]
+                workers = min(len(columns), os.cpu_count() or 1)
+                if workers > 1:
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        results = list(executor.map(_rolling_stats_3, columns))
+                else:
+                    results = [_rolling_stats_3(series) for series in columns]
+                rolling_mean, rolling_std, cumulative = (
+                    pd.concat(stat, axis=1) for stat in zip(*results)
+                )
             
-            # Rolling standard deviation
-            df_engineered[f'{col}_STD3'] = df_engineered[col].rolling(window=3, min_periods=1).std()
+            if self.low_precision:
+                # Cumulative sums stay float64; float32 drifts over long sessions
+                rolling_mean = rolling_mean.astype(np.float32)
+                rolling_std = rolling_std.astype(np.float32)
             
-            # Cumulative sum
-            df_engineered[f'{col}_CUMSUM'] = df_engineered[col].cumsum()
+            # Compute each statistic over the whole block, then attach them in one concat
+            stats = pd.concat([
+                rolling_mean.add_suffix('_MA3'),
+                rolling_std.add_suffix('_STD3'),
+                cumulative.add_suffix('_CUMSUM'),  # Cumulative sum
+            ], axis=1)
+            # Keep the per-column MA3, STD3, CUMSUM ordering
+            order = [f'{col}{suffix}' for col in numeric.columns for suffix in ('_MA3', '_STD3', '_CUMSUM')]
+            df_engineered = pd.concat([df_engineered, stats[order]], axis=1)
         
         # Interaction features (if driver and lap time exist)
-        if 'DRIVER' in df_engineered.columns:
-            for col in numeric_cols:
-                if 'time' in col.lower():
-                    # Driver average lap time
-                    driver_avg = df_engineered.groupby('DRIVER')[col].transform('mean')
-                    df_engineered[f'{col}_VS_DRIVER_AVG'] = df_engineered[col] - driver_avg
+        time_cols = [col for col in numeric_cols if 'time' in col.lower()]
+        if 'DRIVER' in df_engineered.columns and time_cols:
+            # Driver average lap time, for all time columns in one groupby pass
+            times = df_engineered[time_cols]
+            driver_avg = times.groupby(df_engineered['DRIVER'], sort=False, observed=True).transform('mean')
+            vs_avg = times - driver_avg
+            if self.low_precision:
+                vs_avg = vs_avg.astype(np.float32)
+            df_engineered = pd.concat([df_engineered, vs_avg.add_suffix('_VS_DRIVER_AVG')], axis=1)
         
         return df_engineered
     
@@ -293,7 +511,7 @@ class DataTransformer:
         Returns:
             pd.DataFrame: Dataframe with time features.
         """
-        df_time = df.copy()
+        df_time = df.copy(deep=False)
         
         if time_column not in df_time.columns:
             return df_time
@@ -305,12 +523,30 @@ class DataTransformer:
             except:
                 return df_time
         
-        # Extract time features
-        df_time[f'{time_column}_HOUR'] = df_time[time_column].dt.hour
-        df_time[f'{time_column}_MINUTE'] = df_time[time_column].dt.minute
-        df_time[f'{time_column}_SECOND'] = df_time[time_column].dt.second
-        df_time[f'{time_column}_DAY_OF_WEEK'] = df_time[time_column].dt.dayofweek
-        df_time[f'{time_column}_IS_WEEKEND'] = df_time[time_column].dt.dayofweek.isin([5, 6]).astype(int)
+        # Extract time features with integer arithmetic on one pass of epoch seconds
+        times = df_time[time_column]
+        if times.dt.tz is not None:
+            times = times.dt.tz_localize(None)  # Fields are local wall-clock time
+        values = times.to_numpy(dtype='datetime64[ns]')
+        missing = np.isnat(values)
+        secs = values.view(np.int64) // 1_000_000_000
+        day_of_week = (secs // 86400 + 3) % 7  # 1970-01-01 was a Thursday
+        
+        fields = {
+            'HOUR': secs // 3600 % 24,
+            'MINUTE': secs // 60 % 60,
+            'SECOND': secs % 60,
+            'DAY_OF_WEEK': day_of_week,
+        }
+        int_dtype = np.int8 if self.low_precision else np.int32
+        for name, field in fields.items():
+            # Missing timestamps give NaN, as the .dt accessors do
+            df_time[f'{time_column}_{name}'] = (
+                np.where(missing, np.nan, field) if missing.any() else field.astype(int_dtype)
+            )
+        df_time[f'{time_column}_IS_WEEKEND'] = ((day_of_week >= 5) & ~missing).astype(
+            np.int8 if self.low_precision else int
+        )
         
         return df_time
     
@@ -324,16 +560,16 @@ class DataTransformer:
         Returns:
             pd.DataFrame: Dataframe with normalized column names.
         """
-        df_normalized = df.copy()
-        
-        # Convert to uppercase and replace spaces with underscores
-        new_columns = {}
-        for col in df_normalized.columns:
-            new_col = str(col).strip().upper().replace(' ', '_')
-            new_col = re.sub(r'[^\w\s]', '', new_col)  # Remove special characters
-            new_columns[col] = new_col
+        df_normalized = df.copy(deep=False)
         
-        df_normalized.rename(columns=new_columns, inplace=True)
+        # Convert to uppercase, replace spaces with underscores, remove special characters
+        df_normalized.columns = (
+            df_normalized.columns.astype(str)
+            .str.strip()
+            .str.upper()
+            .str.replace(' ', '_', regex=False)
+            .str.replace(_SPECIAL_CHARS_RE, '', regex=True)
+        )
         
         return df_normalized
 
@@ -349,21 +585,21 @@ class DataTransformer:
         """
         # Check if necessary columns exist
         required_cols = ['telemetry_name', 'telemetry_value']
-        # Case insensitive check
-        df_cols_lower = [c.lower() for c in df.columns]
+        # Case insensitive check; each name is lower-cased once
+        cols_lower = [(c, str(c).lower()) for c in df.columns]
+        col_map = {lower: c for c, lower in cols_lower}
         
-        if not all(col in df_cols_lower for col in required_cols):
+        if not all(col in col_map for col in required_cols):
             return df
             
-        print("Detected long-format telemetry data. Pivoting...")
+        logger.info("Detected long-format telemetry data. Pivoting...")
         
         # Map actual column names
-        col_map = {c.lower(): c for c in df.columns}
         name_col = col_map['telemetry_name']
         val_col = col_map['telemetry_value']
         
         # Identify index columns (everything else)
-        index_cols = [c for c in df.columns if c.lower() not in required_cols]
+        index_cols = [c for c, lower in cols_lower if lower not in required_cols]
         
         # We need a unique index for pivoting. 
         # Usually timestamp + vehicle + lap is good, but timestamp might be duplicated for different sensors.
@@ -372,29 +608,34 @@ class DataTransformer:
         # Find potential index columns like timestamp, vehicle_id, lap
         potential_indices = []
         for key in ['timestamp', 'time', 'meta_time', 'vehicle_id', 'vehicle_number', 'lap', 'outing']:
-            for col in df.columns:
-                if key in col.lower():
+            for col, lower in cols_lower:
+                if key in lower:
                     potential_indices.append(col)
         
-        potential_indices = list(set(potential_indices))
+        potential_indices = list(dict.fromkeys(potential_indices))
         
         if not potential_indices:
-            print("Warning: Could not identify index columns for pivoting.")
+            logger.warning("Could not identify index columns for pivoting.")
             return df
             
         try:
-            # Pivot the table
-            # We use pivot_table with 'first' aggregation to handle duplicates if any
-            df_pivoted = df.pivot_table(
-                index=potential_indices,
-                columns=name_col,
-                values=val_col,
-                aggfunc='first'
-            ).reset_index()
+            # Pivot the table. groupby().first() keeps the first non-null reading
+            # per key, as pivot_table(aggfunc='first') did, but without sorting
+            # the keys: rows come out in the order they first appear. Value
+            # columns stay sorted by name
+            keys = potential_indices + [name_col]
+            df_pivoted = (
+                df.groupby(keys, sort=False)[val_col].first()
+                .unstack(name_col)
+                .dropna(how='all')
+                .dropna(axis=1, how='all')
+                .sort_index(axis=1)
+                .reset_index()
+            )
             
-            print(f"Pivoted data: {len(df_pivoted)} rows, {len(df_pivoted.columns)} columns")
+            logger.info("Pivoted data: %d rows, %d columns", len(df_pivoted), len(df_pivoted.columns))
             return df_pivoted
             
         except Exception as e:
-            print(f"Error pivoting data: {e}")
+            logger.error("Error pivoting data: %s", e)
             return df
@@ -8,14 +8,28 @@ telemetry data and analysis reports.
 import pandas as pd
 from typing import Dict, Optional
 from datetime import datetime
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
 import os
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; CSV export falls back to pandas
+    pa = None
+    pa_csv = None
+
+
+def _arrow_writable(values) -> bool:
+    """Return True for columns pyarrow writes to CSV exactly as df.to_csv does."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.cat.categories
+    # Arrow drops the decimal point of whole floats and shortens exponents
+    # (95.0 -> 95, 1.5e-07 -> 1.5e-7), and spells booleans and dates its own way
+    if values.dtype == object:
+        return pd.api.types.infer_dtype(values, skipna=True) in ('string', 'empty')
+    if pd.api.types.is_bool_dtype(values.dtype):
+        return False
+    return pd.api.types.is_integer_dtype(values.dtype) or pd.api.types.is_string_dtype(values.dtype)
+
 
 class CSVExporter:
     """
@@ -24,6 +38,9 @@ class CSVExporter:
     Handles exporting dataframes with optional filtering and formatting.
     """
     
+    # Rows converted to Arrow at a time, to bound the extra memory used
+    BATCH_ROWS = 65536
+    
     @staticmethod
     def export(df: pd.DataFrame, filepath: str, include_index: bool = False) -> bool:
         """
@@ -38,12 +55,54 @@ class CSVExporter:
             bool: True if export was successful, False otherwise.
         """
         try:
-            df.to_csv(filepath, index=include_index)
+            if not CSVExporter._write_arrow(df, filepath, include_index):
+                df.to_csv(filepath, index=include_index)
             print(f"Successfully exported data to {filepath}")
             return True
         except Exception as e:
             print(f"Error exporting CSV: {e}")
             return False
+    
+    @staticmethod
+    def _write_arrow(df: pd.DataFrame, filepath: str, include_index: bool) -> bool:
+        """
+        Write a dataframe with pyarrow's multithreaded CSV writer.
+        
+        Only frames of integers and text are written this way. pandas writes
+        the header line, and Arrow writes the rows unquoted; a value that
+        would need quoting makes Arrow fail, and pandas writes the file.
+        
+        Args:
+            df (pd.DataFrame): The dataframe to export.
+            filepath (str): The output file path.
+            include_index (bool): Whether to include the index column.
+        
+        Returns:
+            bool: False if pyarrow is missing or cannot represent the data.
+        """
+        # Arrow ends lines with \n, pandas with os.linesep
+        if pa_csv is None or os.linesep != '\n':
+            return False
+        # Positional names, so the body does not depend on the labels
+        body = df.set_axis([str(i) for i in range(df.shape[1])], axis=1)
+        if include_index:
+            body = body.reset_index(allow_duplicates=True)
+        # pandas quotes an empty value that would leave a row blank
+        if body.shape[1] < 2 or not all(_arrow_writable(values) for _, values in body.items()):
+            return False
+        try:
+            df.iloc[:0].to_csv(filepath, index=include_index)
+            schema = pa.Schema.from_pandas(body, preserve_index=False)
+            options = pa_csv.WriteOptions(include_header=False, quoting_style='none')
+            with open(filepath, 'ab') as sink, pa_csv.CSVWriter(sink, schema, write_options=options) as writer:
+                for start in range(0, len(body), CSVExporter.BATCH_ROWS):
+                    chunk = body.iloc[start:start + CSVExporter.BATCH_ROWS]
+                    writer.write_batch(pa.RecordBatch.from_pandas(chunk, schema=schema, preserve_index=False))
+        except pa.ArrowException:
+            # Mixed-type object columns cannot be converted, and values with
+            # commas, quotes or line breaks need quoting; pandas writes those
+            return False
+        return True
 
 
 class PDFReporter:
@@ -56,11 +115,18 @@ class PDFReporter:
     
     def __init__(self):
         """Initialize the PDF reporter."""
+        # reportlab is imported here rather than at module level, so CSV export
+        # does not pay for loading it
+        from reportlab.lib.styles import getSampleStyleSheet
         self.styles = getSampleStyleSheet()
         self._setup_custom_styles()
     
     def _setup_custom_styles(self):
         """Set up custom paragraph styles."""
+        from reportlab.lib import colors
+        from reportlab.lib.enums import TA_CENTER
+        from reportlab.lib.styles import ParagraphStyle
+        
         # Title style
         self.styles.add(ParagraphStyle(
             name='CustomTitle',
@@ -104,6 +170,11 @@ class PDFReporter:
         Returns:
             bool: True if report generation was successful, False otherwise.
         """
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+        
         try:
             doc = SimpleDocTemplate(filepath, pagesize=letter,
                                    rightMargin=72, leftMargin=72,
@@ -206,10 +277,8 @@ class PDFReporter:
             if display_columns:
                 sample_data = data[display_columns].head(10)
                 
-                # Create table data
-                table_data = [display_columns]  # Header row
-                for idx, row in sample_data.iterrows():
-                    table_data.append([str(row[col]) for col in display_columns])
+                # Create table data: header row, then the sample as strings
+                table_data = [display_columns] + sample_data.astype(str).values.tolist()
                 
                 # Create table
                 data_table = Table(table_data)
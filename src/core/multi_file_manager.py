@@ -7,11 +7,29 @@ detecting relationships, and intelligently merging data.
 
 import pandas as pd
 import numpy as np
+import logging
 from typing import Dict, List, Tuple, Optional, Any
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from fuzzywuzzy import fuzz
+from itertools import combinations
+import hashlib
 import os
+import re
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # rapidfuzz is optional; fuzzywuzzy scores pairs one at a time
+    from fuzzywuzzy import fuzz
+    process = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; files are then read with pd.read_csv
+    pa = None
+    pa_csv = None
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -41,25 +59,66 @@ class MultiFileManager:
     Manages multiple CSV file imports and intelligent merging.
     """
     
+    # Rows sampled per frame to screen out repetitive join-key candidates
+    KEY_SAMPLE_ROWS = 50_000
+    
+    # Similarity matrices kept; the least recently used is dropped first
+    SIMILARITY_CACHE_SIZE = 64
+    
     def __init__(self):
         """Initialize the manager."""
         self.files: Dict[str, pd.DataFrame] = {}
         self.file_info: Dict[str, FileInfo] = {}
         self.relationships: List[RelationshipInfo] = []
+        # Name-similarity matrices keyed by the two lower-cased column tuples and
+        # cutoff, in least recently used order
+        self._similarity_cache: Dict[Tuple[Tuple[str, ...], Tuple[str, ...], float], np.ndarray] = {}
+        # Arrow column types of the first file read for each header hash
+        self._column_types: Dict[str, Dict[str, Any]] = {}
     
     def import_multiple_files(self, filepaths: List[str]) -> Dict[str, pd.DataFrame]:
         """
         Import multiple CSV files.
         
+        Files are read with pyarrow when it is installed. The column types
+        inferred for the first file with a given header are reused for the
+        other files with that header, so only one of them pays for inference.
+        
         Args:
             filepaths (List[str]): List of file paths to import.
         
         Returns:
             Dict[str, pd.DataFrame]: Dictionary mapping filenames to dataframes.
         """
+        # Files whose header has not been seen yet are read first, so that the
+        # rest can reuse their column types
+        header_hashes = [self._header_hash(filepath) for filepath in filepaths]
+        firsts = {}
+        for filepath, header_hash in zip(filepaths, header_hashes):
+            if header_hash is not None and header_hash not in self._column_types:
+                firsts.setdefault(header_hash, filepath)
+        first_paths = set(firsts.values())
+        batches = (
+            [(p, h) for p, h in zip(filepaths, header_hashes) if p in first_paths],
+            [(p, h) for p, h in zip(filepaths, header_hashes) if p not in first_paths],
+        )
+        
+        # Arrow already spreads each file over all cores; pandas' C tokenizer
+        # releases the GIL, so without pyarrow the files are parsed concurrently.
+        # Either way they are registered in the order given
+        workers = 1 if pa_csv is not None else max(1, min(8, len(filepaths)))
+        reads = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for batch in batches:
+                futures = {filepath: executor.submit(self._read_file, filepath, header_hash)
+                           for filepath, header_hash in batch}
+                wait(futures.values())
+                reads.update(futures)
+        
         for filepath in filepaths:
+            read = reads[filepath]
             try:
-                df = pd.read_csv(filepath)
+                df = read.result()
                 filename = os.path.basename(filepath)
                 
                 self.files[filename] = df
@@ -72,9 +131,9 @@ class MultiFileManager:
                     schema_hash=self._generate_schema_hash(df)
                 )
                 
-                print(f"Imported {filename}: {len(df)} rows, {len(df.columns)} columns")
+                logger.info("Imported %s: %d rows, %d columns", filename, len(df), len(df.columns))
             except Exception as e:
-                print(f"Error importing {filepath}: {e}")
+                logger.error("Error importing %s: %s", filepath, e)
         
         # Detect relationships after all files are loaded
         if len(self.files) > 1:
@@ -82,6 +141,67 @@ class MultiFileManager:
         
         return self.files
     
+    @staticmethod
+    def _header_hash(filepath: str) -> Optional[str]:
+        """Hash the header line of a CSV file, or None if it cannot be read."""
+        try:
+            with open(filepath, 'rb') as f:
+                header = f.readline()
+        except OSError:
+            return None
+        return hashlib.blake2b(header, digest_size=16).hexdigest()
+    
+    def _read_file(self, filepath: str, header_hash: Optional[str]) -> pd.DataFrame:
+        """
+        Read one CSV file, reusing the column types cached for its header.
+        
+        Arrow infers dates and times where pd.read_csv keeps text, so such
+        columns are read again as strings. Files Arrow cannot read with the
+        cached types (e.g. an integer column that now has gaps) and files with
+        repeated column names go to pd.read_csv.
+        
+        Args:
+            filepath (str): Path to CSV file.
+            header_hash (Optional[str]): Hash of the file's header line.
+        
+        Returns:
+            pd.DataFrame: The loaded data.
+        """
+        if pa_csv is None or header_hash is None:
+            return pd.read_csv(filepath)
+        
+        column_types = dict(self._column_types.get(header_hash, {}))
+        try:
+            table = pa_csv.read_csv(filepath, convert_options=pa_csv.ConvertOptions(
+                column_types=column_types, strings_can_be_null=True))
+            temporal = [field.name for field in table.schema if pa.types.is_temporal(field.type)]
+            if temporal:
+                column_types.update(dict.fromkeys(temporal, pa.string()))
+                table = pa_csv.read_csv(filepath, convert_options=pa_csv.ConvertOptions(
+                    column_types=column_types, strings_can_be_null=True))
+        except (pa.ArrowInvalid, UnicodeDecodeError) as e:
+            logger.debug("Arrow could not read %s (%s); using pandas", filepath, e)
+            return pd.read_csv(filepath)
+        
+        # pandas de-duplicates repeated headers; leave that case to it
+        if len(set(table.column_names)) != len(table.column_names):
+            return pd.read_csv(filepath)
+        
+        # All-empty columns are left to inference in the other files
+        self._column_types.setdefault(header_hash, {
+            field.name: field.type for field in table.schema if not pa.types.is_null(field.type)
+        })
+        
+        null_cols = [f.name for f in table.schema if pa.types.is_null(f.type)]
+        str_cols = [f.name for f in table.schema if pa.types.is_string(f.type)]
+        df = table.to_pandas(self_destruct=True)
+        # Match pd.read_csv: empty columns are float NaN, and missing text is NaN
+        if null_cols:
+            df[null_cols] = df[null_cols].astype('float64')
+        if str_cols:
+            df[str_cols] = df[str_cols].where(df[str_cols].notna(), np.nan)
+        return df
+    
     def detect_relationships(self) -> List[RelationshipInfo]:
         """
         Detect relationships between imported files.
@@ -90,17 +210,26 @@ class MultiFileManager:
             List[RelationshipInfo]: List of detected relationships.
         """
         relationships = []
-        filenames = list(self.files.keys())
+        
+        # Name tokens of each file, e.g. 'FL_TIME' -> {'fl', 'time'}
+        tokens = {
+            filename: frozenset(token for col in df.columns
+                                for token in re.split(r'[_\W]+', str(col).lower()) if token)
+            for filename, df in self.files.items()
+        }
         
         # Compare each pair of files
-        for i in range(len(filenames)):
-            for j in range(i + 1, len(filenames)):
-                file1 = filenames[i]
-                file2 = filenames[j]
-                
-                relationship = self._analyze_relationship(file1, file2)
-                if relationship:
-                    relationships.append(relationship)
+        for file1, file2 in combinations(self.files, 2):
+            # Files sharing no column and almost no name tokens are unrelated;
+            # skip the fuzzy pass for them
+            if self.files[file1].columns.intersection(self.files[file2].columns).empty:
+                union = tokens[file1] | tokens[file2]
+                if not union or len(tokens[file1] & tokens[file2]) / len(union) < 0.1:
+                    continue
+            
+            relationship = self._analyze_relationship(file1, file2)
+            if relationship:
+                relationships.append(relationship)
         
         return relationships
     
@@ -160,18 +289,59 @@ class MultiFileManager:
         Returns:
             List[str]: List of similar column pairs.
         """
-        similar = []
+        cols1, cols2 = list(cols1), list(cols2)
+        if not cols1 or not cols2:
+            return []
+        
+        # fuzzywuzzy reports rounded integer ratios, so anything from
+        # threshold - 0.5 up can still round to a match
+        scores = self._similarity_scores(tuple(col.lower() for col in cols1),
+                                         tuple(col.lower() for col in cols2),
+                                         threshold - 0.5)
+        
+        pairs = np.argwhere(np.rint(scores) >= threshold)
+        return [f"{cols1[i]}~{cols2[j]}" for i, j in pairs if cols1[i] != cols2[j]]
+    
+    def _similarity_scores(self, lower1: Tuple[str, ...], lower2: Tuple[str, ...],
+                           cutoff: float) -> np.ndarray:
+        """
+        Return the fuzz.ratio matrix for two lists of lower-cased names.
         
-        for col1 in cols1:
-            for col2 in cols2:
-                if col1 == col2:
-                    continue
-                
-                similarity = fuzz.ratio(col1.lower(), col2.lower())
-                if similarity >= threshold:
-                    similar.append(f"{col1}~{col2}")
+        Files that share a schema produce the same name lists, so the last
+        SIMILARITY_CACHE_SIZE matrices are kept; the ratio is symmetric, so a
+        cached matrix for the swapped pair is reused transposed.
         
-        return similar
+        Args:
+            lower1 (Tuple[str, ...]): Lower-cased columns from the first dataframe.
+            lower2 (Tuple[str, ...]): Lower-cased columns from the second dataframe.
+            cutoff (float): Scores below this are reported as 0.
+        
+        Returns:
+            np.ndarray: Scores with one row per name in lower1.
+        """
+        for key, transpose in (((lower1, lower2, cutoff), False), ((lower2, lower1, cutoff), True)):
+            cached = self._similarity_cache.pop(key, None)
+            if cached is not None:
+                self._similarity_cache[key] = cached
+                return cached.T if transpose else cached
+        
+        if process is not None:
+            # Whole score matrix in native code
+            scores = process.cdist(lower1, lower2, scorer=fuzz.ratio, score_cutoff=cutoff, workers=-1)
+        else:
+            # The ratio is at most 200 * min(len) / (len1 + len2), so pairs of very
+            # different lengths are rejected without running the scorer
+            scores = np.array([
+                [fuzz.ratio(col1, col2)
+                 if 200 * min(len(col1), len(col2)) >= cutoff * (len(col1) + len(col2)) else 0
+                 for col2 in lower2]
+                for col1 in lower1
+            ])
+        
+        self._similarity_cache[(lower1, lower2, cutoff)] = scores
+        if len(self._similarity_cache) > self.SIMILARITY_CACHE_SIZE:
+            del self._similarity_cache[next(iter(self._similarity_cache))]
+        return scores
     
     def _suggest_join_keys(self, df1: pd.DataFrame, df2: pd.DataFrame, 
                           common_columns: List[str]) -> List[str]:
@@ -191,19 +361,34 @@ class MultiFileManager:
         # Priority keywords for join keys
         priority_keywords = ['id', 'number', 'driver', 'lap', 'time', 'position']
         
-        for col in common_columns:
-            col_lower = col.lower()
+        # Columns whose name suggests a key and that exist in both frames
+        candidates = [
+            col for col in common_columns
+            if any(keyword in col.lower() for keyword in priority_keywords)
+            and col in df1.columns and col in df2.columns
+        ]
+        
+        # Heuristic screen for long frames: a sample's share of distinct values
+        # is usually close to or above the whole column's, so candidates well
+        # below the 0.1 cut in a sample are dropped without a full pass. The
+        # margin keeps sampling noise from rejecting a borderline key
+        for df in (df1, df2):
+            if candidates and len(df) > self.KEY_SAMPLE_ROWS:
+                rows = np.random.default_rng(0).choice(len(df), self.KEY_SAMPLE_ROWS, replace=False)
+                sample = df[candidates].take(rows)
+                sample_ratio = sample.nunique() / len(sample)
+                candidates = [col for col in candidates if sample_ratio[col] > 0.05]
+        
+        if candidates:
+            # Check if values are suitable for joining (not all unique or all same);
+            # one nunique pass per frame over all candidates
+            unique_ratio1 = df1[candidates].nunique() / len(df1)
+            unique_ratio2 = df2[candidates].nunique() / len(df2)
             
-            # Check if column name suggests it's a key
-            if any(keyword in col_lower for keyword in priority_keywords):
-                # Check if values are suitable for joining (not all unique or all same)
-                if col in df1.columns and col in df2.columns:
-                    unique_ratio1 = df1[col].nunique() / len(df1)
-                    unique_ratio2 = df2[col].nunique() / len(df2)
-                    
-                    # Good join key has moderate uniqueness (not 100%, not 0%)
-                    if 0.1 < unique_ratio1 < 0.9 and 0.1 < unique_ratio2 < 0.9:
-                        join_keys.append(col)
+            # Good join key has moderate uniqueness (not 100%, not 0%)
+            for col in candidates:
+                if 0.1 < unique_ratio1[col] < 0.9 and 0.1 < unique_ratio2[col] < 0.9:
+                    join_keys.append(col)
         
         # If no good keys found, use first common column
         if not join_keys and common_columns:
@@ -232,11 +417,15 @@ class MultiFileManager:
         if key not in df1.columns or key not in df2.columns:
             return 'outer'
         
-        values1 = set(df1[key].dropna().unique())
-        values2 = set(df2[key].dropna().unique())
+        values1 = df1[key].dropna().unique()
+        values2 = df2[key].dropna().unique()
         
-        overlap = len(values1 & values2)
-        total = len(values1 | values2)
+        if pd.api.types.is_numeric_dtype(df1[key]) and pd.api.types.is_numeric_dtype(df2[key]):
+            # Sorted merge of the unique arrays, without boxing every value
+            overlap = np.intersect1d(values1, values2, assume_unique=True).size
+        else:
+            overlap = len(set(values1) & set(values2))
+        total = len(values1) + len(values2) - overlap
         
         overlap_ratio = overlap / total if total > 0 else 0
         
@@ -308,13 +497,18 @@ class MultiFileManager:
         Returns:
             pd.DataFrame: Concatenated dataframe.
         """
-        dfs = [self.files[f] for f in filenames if f in self.files]
+        sources = [f for f in filenames if f in self.files]
+        dfs = [self.files[f] for f in sources]
         
-        # Add source column to track origin
-        for i, df in enumerate(dfs):
-            df['_source_file'] = filenames[i]
+        result = pd.concat(dfs, ignore_index=True)
         
-        return pd.concat(dfs, ignore_index=True)
+        # Add source column to track origin; built once as codes, without
+        # writing into the stored frames
+        codes, categories = pd.factorize(pd.Index(sources))
+        result['_source_file'] = pd.Categorical.from_codes(
+            np.repeat(codes, [len(df) for df in dfs]), categories=categories
+        )
+        return result
     
     def _merge_by_join(self, filenames: List[str]) -> pd.DataFrame:
         """
@@ -329,41 +523,123 @@ class MultiFileManager:
         if len(filenames) < 2:
             return self.files[filenames[0]] if filenames else pd.DataFrame()
         
-        # Start with first file
-        result = self.files[filenames[0]].copy()
+        # Relationship of each file with the first one (first match wins)
+        relationships = {}
+        for rel in self.relationships:
+            relationships.setdefault(frozenset((rel.file1, rel.file2)), rel)
+        
+        # Start with first file; every join below returns a new frame, so the
+        # stored one is never modified and needs no defensive copy
+        result = self.files[filenames[0]]
+        # Files with no relationship, waiting to be outer-joined on the index
+        pending = []
         
         # Join with each subsequent file
         for i in range(1, len(filenames)):
             # Find relationship
-            relationship = None
-            for rel in self.relationships:
-                if (rel.file1 == filenames[0] and rel.file2 == filenames[i]) or \
-                   (rel.file2 == filenames[0] and rel.file1 == filenames[i]):
-                    relationship = rel
-                    break
+            relationship = relationships.get(frozenset((filenames[0], filenames[i])))
             
             if relationship and relationship.join_keys:
+                result = self._join_on_index(result, pending)
+                pending = []
+                
                 # Perform join
                 join_key = relationship.join_keys[0]
                 join_type = relationship.suggested_join_type
                 
-                result = result.merge(
-                    self.files[filenames[i]],
-                    on=join_key,
-                    how=join_type,
-                    suffixes=('', f'_{i}')
-                )
+                # Suffix clashing columns up front, as suffixes=('', f'_{i}') would
+                other = self.files[filenames[i]]
+                overlap = set(result.columns).intersection(other.columns) - {join_key}
+                other = self._suffix_columns(other, overlap, i)
+                result, other = self._categorize_join_key(result, other, join_key)
+                
+                result = result.merge(other, on=join_key, how=join_type)
             else:
                 # No relationship found - use outer join on index
-                result = result.merge(
-                    self.files[filenames[i]],
-                    left_index=True,
-                    right_index=True,
-                    how='outer',
-                    suffixes=('', f'_{i}')
-                )
+                pending.append((i, self.files[filenames[i]]))
         
-        return result
+        return self._join_on_index(result, pending)
+    
+    @staticmethod
+    def _suffix_columns(df: pd.DataFrame, columns: set, i: int) -> pd.DataFrame:
+        """Return df with the given columns renamed to ``{col}_{i}``, sharing its data."""
+        if not columns:
+            return df
+        df = df.copy(deep=False)
+        df.columns = [f'{col}_{i}' if col in columns else col for col in df.columns]
+        return df
+    
+    @staticmethod
+    def _categorize_join_key(left: pd.DataFrame, right: pd.DataFrame,
+                             key: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Give a string join key the same categorical dtype on both sides.
+        
+        Pandas then merges on the integer codes instead of hashing every
+        string. Categories are sorted so outer joins keep their key order;
+        keys with missing values are left alone, as a categorical outer
+        join would place them first instead of last.
+        
+        Args:
+            left (pd.DataFrame): Left side of the merge.
+            right (pd.DataFrame): Right side of the merge.
+            key (str): Join column present in both frames.
+        
+        Returns:
+            Tuple[pd.DataFrame, pd.DataFrame]: Frames sharing their data with the inputs.
+        """
+        columns = (left[key], right[key])
+        if not all(
+            pd.api.types.is_string_dtype(col) or isinstance(col.dtype, pd.CategoricalDtype)
+            for col in columns
+        ) or any(col.hasnans for col in columns):
+            return left, right
+        
+        # Index.union sorts and also accepts object and string[pyarrow] together
+        categories = pd.Index(columns[0].unique()).union(pd.Index(columns[1].unique()))
+        dtype = pd.CategoricalDtype(categories)
+        
+        left, right = left.copy(deep=False), right.copy(deep=False)
+        left[key] = columns[0].astype(dtype)
+        right[key] = columns[1].astype(dtype)
+        return left, right
+    
+    @staticmethod
+    def _join_on_index(result: pd.DataFrame, others: List[Tuple[int, pd.DataFrame]]) -> pd.DataFrame:
+        """
+        Outer-join several frames onto result by index in a single concat.
+        
+        Gives the same frame as chaining
+        ``result.merge(df, left_index=True, right_index=True, how='outer',
+        suffixes=('', f'_{i}'))`` over ``others``: a column already present
+        gets the ``_{i}`` suffix of the file that brings it in. Concat needs
+        unique indexes, so frames with repeated index labels are joined with
+        that chain of merges instead.
+        
+        Args:
+            result (pd.DataFrame): Frame joined so far.
+            others (List[Tuple[int, pd.DataFrame]]): (file position, frame) pairs.
+        
+        Returns:
+            pd.DataFrame: Joined dataframe.
+        """
+        if not others:
+            return result
+        
+        if not (result.index.is_unique and all(df.index.is_unique for _, df in others)):
+            for i, df in others:
+                result = result.merge(df, left_index=True, right_index=True, how='outer',
+                                      suffixes=('', f'_{i}'))
+            return result
+        
+        seen = set(result.columns)
+        frames = [result]
+        for i, df in others:
+            df = MultiFileManager._suffix_columns(df, seen.intersection(df.columns), i)
+            seen.update(df.columns)
+            frames.append(df)
+        
+        return pd.concat(frames, axis=1, join='outer', sort=True)
     
     def compare_schemas(self, filenames: Optional[List[str]] = None) -> pd.DataFrame:
         """
@@ -378,29 +654,30 @@ class MultiFileManager:
         if filenames is None:
             filenames = list(self.files.keys())
         
+        # Column -> dtype name for each file, built once per file
+        dtypes = {
+            filename: {col: str(dtype) for col, dtype in self.files[filename].dtypes.items()}
+            for filename in filenames if filename in self.files
+        }
+        
         # Get all unique columns
         all_columns = set()
-        for filename in filenames:
-            if filename in self.files:
-                all_columns.update(self.files[filename].columns)
+        for file_dtypes in dtypes.values():
+            all_columns.update(file_dtypes)
         
         # Create comparison matrix
         comparison = {}
         for col in sorted(all_columns):
-            comparison[col] = {}
-            for filename in filenames:
-                if filename in self.files:
-                    if col in self.files[filename].columns:
-                        dtype = str(self.files[filename][col].dtype)
-                        comparison[col][filename] = dtype
-                    else:
-                        comparison[col][filename] = '-'
+            comparison[col] = {
+                filename: file_dtypes.get(col, '-') for filename, file_dtypes in dtypes.items()
+            }
         
         return pd.DataFrame(comparison).T
     
     def _generate_schema_hash(self, df: pd.DataFrame) -> str:
-        """Generate a hash representing the schema."""
-        return '|'.join(sorted(df.columns))
+        """Generate a fixed-size hash representing the schema (column names)."""
+        names = '|'.join(sorted(map(str, df.columns)))
+        return hashlib.blake2b(names.encode(), digest_size=16).hexdigest()
     
     def get_summary(self) -> Dict[str, Any]:
         """
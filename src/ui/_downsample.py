@@ -0,0 +1,100 @@
+"""
+Preparation of long traces before they are handed to matplotlib.
+
+Traces are sorted by x with missing points dropped, then downsampled:
+each bucket of ``ds`` consecutive samples is reduced to its lowest and
+highest point, kept in their original order, so a line drawn through the
+result covers the same pixels as the full trace at screen resolution.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:  # numba is optional; the NumPy version is used instead
+    _HAS_NUMBA = False
+
+
+def _minmax_downsample_numpy(x, y, ds):
+    """NumPy version of minmax_downsample."""
+    n_buckets = len(y) // ds
+    if n_buckets == 0:
+        return x.copy(), y.copy()
+    buckets = y[:n_buckets * ds].reshape(n_buckets, ds)
+    starts = np.arange(n_buckets) * ds
+    lo = starts + buckets.argmin(axis=1)
+    hi = starts + buckets.argmax(axis=1)
+    picks = np.column_stack([np.minimum(lo, hi), np.maximum(lo, hi)]).ravel()
+    picks = np.concatenate([picks, np.arange(n_buckets * ds, len(y))])
+    return x[picks], y[picks]
+
+
+if _HAS_NUMBA:
+    @njit(cache=True)
+    def _minmax_downsample_numba(x, y, ds):
+        """Numba version of minmax_downsample."""
+        n_buckets = len(y) // ds
+        tail = len(y) - n_buckets * ds
+        x_out = np.empty(2 * n_buckets + tail, dtype=x.dtype)
+        y_out = np.empty(2 * n_buckets + tail, dtype=y.dtype)
+        for b in range(n_buckets):
+            start = b * ds
+            lo = start
+            hi = start
+            for i in range(start + 1, start + ds):
+                if y[i] < y[lo]:
+                    lo = i
+                if y[i] > y[hi]:
+                    hi = i
+            first, second = min(lo, hi), max(lo, hi)
+            x_out[2 * b] = x[first]
+            y_out[2 * b] = y[first]
+            x_out[2 * b + 1] = x[second]
+            y_out[2 * b + 1] = y[second]
+        for i in range(tail):
+            x_out[2 * n_buckets + i] = x[n_buckets * ds + i]
+            y_out[2 * n_buckets + i] = y[n_buckets * ds + i]
+        return x_out, y_out
+
+
+def sort_and_drop_nan(x: np.ndarray, y: np.ndarray):
+    """
+    Sort points by x and drop those where x or y is NaN.
+
+    Gives the same points in the same order as sort_values(x) followed by
+    dropna() on a DataFrame, ties included.
+
+    Args:
+        x (np.ndarray): Float x values.
+        y (np.ndarray): Float y values, same length as x.
+
+    Returns:
+        tuple: (x, y) arrays, sorted by x.
+    """
+    keep = np.flatnonzero(~np.isnan(x))
+    order = keep[x[keep].argsort()]
+    order = order[~np.isnan(y[order])]
+    return x[order], y[order]
+
+
+def minmax_downsample(x: np.ndarray, y: np.ndarray, ds: int):
+    """
+    Keep the minimum and maximum of every ``ds`` samples.
+
+    Samples left over after the last full bucket are kept as they are.
+    Inputs must not contain NaN.
+
+    Args:
+        x (np.ndarray): X values, in drawing order.
+        y (np.ndarray): Y values, same length as x.
+        ds (int): Bucket size; 1 or less returns the input unchanged.
+
+    Returns:
+        tuple: (x, y) arrays with two points per bucket.
+    """
+    if ds <= 1:
+        return x, y
+    if _HAS_NUMBA:
+        return _minmax_downsample_numba(x, y, ds)
+    return _minmax_downsample_numpy(x, y, ds)
@@ -1,14 +1,74 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                             QPushButton, QLabel, QFileDialog, QTabWidget, QTableWidget, 
-                             QTableWidgetItem, QMessageBox)
-from PyQt6.QtCore import Qt
+                             QPushButton, QLabel, QFileDialog, QTabWidget, QTableView, 
+                             QMessageBox)
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
 import sys
 import os
+import numpy as np
 
 # Add src to path to import core modules
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 from src.core.data_loader import DataLoader
 
+
+class DataFrameModel(QAbstractTableModel):
+    """
+    Read-only table model over a pandas DataFrame.
+
+    The frame is held by reference and cells are formatted on request, so
+    the view only ever converts the cells that are on screen. Each column is
+    turned into an array the first time one of its cells is shown,
+    so later cells are plain NumPy lookups instead of ``iat`` calls.
+    """
+    def __init__(self, df=None, parent=None):
+        """Initialize the model, optionally with a dataframe to show."""
+        super().__init__(parent)
+        self._df = df
+        self._columns = {}
+
+    def set_dataframe(self, df):
+        """Replace the dataframe shown by the model."""
+        self.beginResetModel()
+        self._df = df
+        self._columns = {}
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        """Number of dataframe rows."""
+        if self._df is None or parent.isValid():
+            return 0
+        return self._df.shape[0]
+
+    def columnCount(self, parent=QModelIndex()):
+        """Number of dataframe columns."""
+        if self._df is None or parent.isValid():
+            return 0
+        return self._df.shape[1]
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Return the cell text for display; other roles use the defaults."""
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        col = index.column()
+        values = self._columns.get(col)
+        if values is None:
+            series = self._df.iloc[:, col]
+            # Numeric columns keep their NumPy scalars so float32 prints as itself;
+            # datetimes and extension types become the objects iat would return
+            if isinstance(series.dtype, np.dtype) and series.dtype.kind not in 'mM':
+                values = series.to_numpy()
+            else:
+                values = series.to_numpy(dtype=object)
+            self._columns[col] = values
+        return str(values[index.row()])
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Column names across the top; row numbers down the side."""
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return str(self._df.columns[section])
+        return super().headerData(section, orientation, role)
+
+
 class MainWindow(QMainWindow):
     """
     The main application window for the Telemetry Analysis Tool.
@@ -48,7 +108,9 @@ class MainWindow(QMainWindow):
         # Tab 1: Data View
         self.data_tab = QWidget()
         self.data_tab_layout = QVBoxLayout(self.data_tab)
-        self.data_table = QTableWidget()
+        self.data_model = DataFrameModel()
+        self.data_table = QTableView()
+        self.data_table.setModel(self.data_model)
         self.data_tab_layout.addWidget(self.data_table)
         self.tabs.addTab(self.data_tab, "Data View")
 
@@ -82,12 +144,6 @@ class MainWindow(QMainWindow):
         if self.data is None:
             return
 
-        df = self.data
-        self.data_table.setRowCount(df.shape[0])
-        self.data_table.setColumnCount(df.shape[1])
-        self.data_table.setHorizontalHeaderLabels(df.columns)
-
-        for i in range(df.shape[0]):
-            for j in range(df.shape[1]):
-                self.data_table.setItem(i, j, QTableWidgetItem(str(df.iloc[i, j])))
+        # The model formats cells lazily, so only visible rows are converted
+        self.data_model.set_dataframe(self.data)
 
@@ -8,17 +8,23 @@ telemetry data including lap times, gaps, speeds, and positions.
 import numpy as np
 import pandas as pd
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QSizePolicy, QScrollArea, QGridLayout
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
 import seaborn as sns
 
+from ._downsample import minmax_downsample, sort_and_drop_nan
+
+# Seaborn style for every chart; set once, as it rewrites the global rcParams
+sns.set_style("darkgrid")
+
 
 class BaseChart(QWidget):
     """
     Base class for all chart widgets.
     
     Provides common functionality for matplotlib integration with PyQt6.
+    Charts request redraws with draw_idle, so Qt renders them from its event
+    loop and merges repeated requests into one draw.
     """
     
     def __init__(self, parent=None):
@@ -35,13 +41,106 @@ class BaseChart(QWidget):
         # Set size policy
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         
-        # Apply seaborn style
-        sns.set_style("darkgrid")
+        # What the margins were last fitted to; see _tight_layout
+        self._layout_key = None
+        
+        # Frame and arguments of the last plot call, to skip repeated plots
+        self._last_plot = None
+        
+        # Axes pixels without the animated overlays, captured after each full draw
+        self._background = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.mpl_connect('resize_event', self._on_resize)
         
     def clear(self):
         """Clear the chart."""
+        self._last_plot = None
         self.ax.clear()
-        self.canvas.draw()
+        self.canvas.draw_idle()
+    
+    def _tight_layout(self):
+        """
+        Fit the margins with tight_layout, unless nothing that sizes them changed.
+        
+        tight_layout renders every text to measure it, so it is skipped when
+        the figure size, title, axis labels and tick labels are the same as
+        at the last fit; formatting the tick labels needs no renderer.
+        """
+        ticks = []
+        for axis in (self.ax.xaxis, self.ax.yaxis):
+            formatter = axis.get_major_formatter()
+            ticks.append(tuple(formatter.format_ticks(axis.get_ticklocs())))
+            ticks.append(formatter.get_offset())
+        key = (tuple(self.figure.get_size_inches()), self.ax.get_title(),
+               self.ax.get_xlabel(), self.ax.get_ylabel(), tuple(ticks))
+        if key != self._layout_key:
+            self._layout_key = key
+            self.figure.tight_layout()
+    
+    def _unchanged(self, df: pd.DataFrame, *args) -> bool:
+        """
+        Check whether plot is being called again with the same data.
+        
+        The frame is compared by identity, length and columns, so a frame
+        modified in place needs clear() before it is plotted again.
+        
+        Args:
+            df (pd.DataFrame): Frame passed to plot.
+            *args: The other plot arguments.
+        
+        Returns:
+            bool: True if the chart already shows this data.
+        """
+        if df is None:
+            self._last_plot = None
+            return False
+        # Holding the frame keeps its id from being reused by another one
+        plot = (df, len(df), tuple(df.columns), args)
+        last, self._last_plot = self._last_plot, plot
+        return (last is not None and last[0] is df
+                and last[1:3] == plot[1:3] and last[3] == args)
+    
+    def _on_draw(self, event):
+        """Cache the static rendering, then paint the animated overlays on top."""
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        for artist in self.ax.get_children():
+            if artist.get_animated() and artist.get_visible():
+                self.ax.draw_artist(artist)
+    
+    def _on_resize(self, event):
+        """Drop the cached background; the next full draw captures a new one."""
+        self._background = None
+    
+    def redraw_data(self, artists):
+        """
+        Repaint only the given animated artists over the cached background.
+        
+        Falls back to a full draw when no background has been captured yet.
+        
+        Args:
+            artists (list): Artists created with animated=True on self.ax.
+        """
+        if self._background is None:
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self._background)
+        for artist in artists:
+            self.ax.draw_artist(artist)
+        self.canvas.blit(self.ax.bbox)
+    
+    @staticmethod
+    def _driver_groups(df: pd.DataFrame):
+        """
+        Split the dataframe by car number in one pass.
+        
+        Args:
+            df (pd.DataFrame): Telemetry dataframe with NUMBER and DRIVER columns.
+        
+        Yields:
+            tuple: (driver name, rows for that car), in order of first appearance.
+        """
+        for _, driver_data in df.groupby('NUMBER', sort=False, observed=True):
+            yield driver_data['DRIVER'].iat[0], driver_data
 
 
 class LapTimeChart(BaseChart):
@@ -56,6 +155,7 @@ class LapTimeChart(BaseChart):
         """Initialize the lap time chart."""
         super().__init__(parent)
         self.anomaly_indices = []
+        self._anomaly_marks = None
         
     def plot(self, df: pd.DataFrame, anomaly_indices=None):
         """
@@ -65,34 +165,36 @@ class LapTimeChart(BaseChart):
             df (pd.DataFrame): Telemetry dataframe with FL_TIME_SEC column.
             anomaly_indices (list, optional): Indices of anomalous data points.
         """
+        if self._unchanged(df, list(anomaly_indices or [])):
+            return
         self.ax.clear()
+        self._anomaly_marks = None
         
         if df is None or df.empty:
             self.ax.text(0.5, 0.5, 'No data available', 
                         ha='center', va='center', transform=self.ax.transAxes)
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
         
         # Check if we have the required columns
         if 'FL_TIME_SEC' not in df.columns:
             self.ax.text(0.5, 0.5, 'FL_TIME_SEC column not found', 
                         ha='center', va='center', transform=self.ax.transAxes)
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
         
         # Group by driver and plot
         if 'DRIVER' in df.columns and 'NUMBER' in df.columns:
-            for driver_num in df['NUMBER'].unique():
-                driver_data = df[df['NUMBER'] == driver_num].copy()
-                driver_data = driver_data.sort_index()
-                
-                # Get driver name
-                driver_name = driver_data['DRIVER'].iloc[0] if not driver_data.empty else f"Car #{driver_num}"
+            # Groups keep row order, so they only need sorting if df does
+            index_sorted = df.index.is_monotonic_increasing
+            for driver_name, driver_data in self._driver_groups(df):
+                if not index_sorted:
+                    driver_data = driver_data.sort_index()
                 
                 # Plot lap times
-                valid_data = driver_data[driver_data['FL_TIME_SEC'].notna()]
+                valid_data = driver_data['FL_TIME_SEC'].dropna()
                 if not valid_data.empty:
-                    self.ax.plot(valid_data.index, valid_data['FL_TIME_SEC'], 
+                    self.ax.plot(valid_data.index, valid_data, 
                                marker='o', label=driver_name, linewidth=2, markersize=6)
         else:
             # Simple plot if driver info not available
@@ -101,22 +203,50 @@ class LapTimeChart(BaseChart):
                 self.ax.plot(valid_data.index, valid_data['FL_TIME_SEC'], 
                            marker='o', linewidth=2, markersize=6)
         
-        # Highlight anomalies
+        # Highlight anomalies; the markers are animated so that
+        # highlight_anomalies can move them without a full redraw
         if anomaly_indices:
             self.anomaly_indices = anomaly_indices
-            for idx in anomaly_indices:
-                if idx < len(df) and pd.notna(df.iloc[idx]['FL_TIME_SEC']):
-                    self.ax.plot(idx, df.iloc[idx]['FL_TIME_SEC'], 
-                               'ro', markersize=12, markerfacecolor='none', 
-                               markeredgewidth=2, label='Anomaly' if idx == anomaly_indices[0] else '')
+        points = self._anomaly_points(df, anomaly_indices or [])
+        self._anomaly_marks = self.ax.scatter(
+            points[:, 0], points[:, 1], s=144, facecolors='none', edgecolors='r',
+            linewidths=2, label='Anomaly' if len(points) else '_nolegend_',
+            zorder=5, animated=True)
         
         self.ax.set_xlabel('Data Point Index', fontsize=12, fontweight='bold')
         self.ax.set_ylabel('Lap Time (seconds)', fontsize=12, fontweight='bold')
         self.ax.set_title('Lap Time Progression', fontsize=14, fontweight='bold')
         self.ax.legend(loc='best')
         self.ax.grid(True, alpha=0.3)
-        self.figure.tight_layout()
-        self.canvas.draw()
+        self._tight_layout()
+        self.canvas.draw_idle()
+    
+    def highlight_anomalies(self, df: pd.DataFrame, anomaly_indices):
+        """
+        Move the anomaly markers to new indices, repainting only the markers.
+        
+        Args:
+            df (pd.DataFrame): The dataframe last passed to plot.
+            anomaly_indices (list): Indices of anomalous data points.
+        """
+        if self._anomaly_marks is None:
+            self.plot(df, anomaly_indices)
+            return
+        if self._unchanged(df, list(anomaly_indices)):
+            return
+        self.anomaly_indices = anomaly_indices
+        self._anomaly_marks.set_offsets(self._anomaly_points(df, anomaly_indices))
+        self.redraw_data([self._anomaly_marks])
+    
+    @staticmethod
+    def _anomaly_points(df: pd.DataFrame, anomaly_indices) -> np.ndarray:
+        """Return (index, lap time) rows for the anomalies that can be drawn."""
+        idxs = np.asarray(anomaly_indices, dtype=np.intp)
+        # Negative indices count from the end, as df.iloc did
+        idxs = idxs[(idxs >= -len(df)) & (idxs < len(df))]
+        vals = df['FL_TIME_SEC'].to_numpy(dtype=float, na_value=np.nan)[idxs]
+        valid = ~np.isnan(vals)
+        return np.column_stack([idxs[valid], vals[valid]])
 
 
 class GapAnalysisChart(BaseChart):
@@ -137,31 +267,33 @@ class GapAnalysisChart(BaseChart):
         Args:
             df (pd.DataFrame): Telemetry dataframe with GAP_FIRST_SEC column.
         """
+        if self._unchanged(df):
+            return
         self.ax.clear()
         
         if df is None or df.empty:
             self.ax.text(0.5, 0.5, 'No data available', 
                         ha='center', va='center', transform=self.ax.transAxes)
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
         
         if 'GAP_FIRST_SEC' not in df.columns:
             self.ax.text(0.5, 0.5, 'GAP_FIRST_SEC column not found', 
                         ha='center', va='center', transform=self.ax.transAxes)
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
         
         # Plot gaps by driver
         if 'DRIVER' in df.columns and 'NUMBER' in df.columns:
-            for driver_num in df['NUMBER'].unique():
-                driver_data = df[df['NUMBER'] == driver_num].copy()
-                driver_data = driver_data.sort_index()
+            # Groups keep row order, so they only need sorting if df does
+            index_sorted = df.index.is_monotonic_increasing
+            for driver_name, driver_data in self._driver_groups(df):
+                if not index_sorted:
+                    driver_data = driver_data.sort_index()
                 
-                driver_name = driver_data['DRIVER'].iloc[0] if not driver_data.empty else f"Car #{driver_num}"
-                
-                valid_data = driver_data[driver_data['GAP_FIRST_SEC'].notna()]
+                valid_data = driver_data['GAP_FIRST_SEC'].dropna()
                 if not valid_data.empty:
-                    self.ax.plot(valid_data.index, valid_data['GAP_FIRST_SEC'], 
+                    self.ax.plot(valid_data.index, valid_data, 
                                marker='o', label=driver_name, linewidth=2, markersize=6)
         else:
             valid_data = df[df['GAP_FIRST_SEC'].notna()]
@@ -174,8 +306,8 @@ class GapAnalysisChart(BaseChart):
         self.ax.set_title('Gap Analysis', fontsize=14, fontweight='bold')
         self.ax.legend(loc='best')
         self.ax.grid(True, alpha=0.3)
-        self.figure.tight_layout()
-        self.canvas.draw()
+        self._tight_layout()
+        self.canvas.draw_idle()
 
 
 class SpeedDistributionChart(BaseChart):
@@ -196,30 +328,35 @@ class SpeedDistributionChart(BaseChart):
         Args:
             df (pd.DataFrame): Telemetry dataframe with FL_KPH column.
         """
+        if self._unchanged(df):
+            return
         self.ax.clear()
         
         if df is None or df.empty:
             self.ax.text(0.5, 0.5, 'No data available', 
                         ha='center', va='center', transform=self.ax.transAxes)
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
         
         if 'FL_KPH' not in df.columns:
             self.ax.text(0.5, 0.5, 'FL_KPH column not found', 
                         ha='center', va='center', transform=self.ax.transAxes)
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
         
-        speeds = df['FL_KPH'].dropna()
+        speeds = df['FL_KPH'].to_numpy(dtype=float, na_value=np.nan)
+        speeds = speeds[~np.isnan(speeds)]
         
-        if speeds.empty:
+        if speeds.size == 0:
             self.ax.text(0.5, 0.5, 'No speed data available', 
                         ha='center', va='center', transform=self.ax.transAxes)
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
         
-        # Create histogram
-        self.ax.hist(speeds, bins=15, color='skyblue', edgecolor='black', alpha=0.7)
+        # Create histogram; binned here so matplotlib only draws the bars
+        counts, edges = np.histogram(speeds, bins=15)
+        self.ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                    color='skyblue', edgecolor='black', alpha=0.7)
         
         # Add mean line
         mean_speed = speeds.mean()
@@ -231,8 +368,8 @@ class SpeedDistributionChart(BaseChart):
         self.ax.set_title('Speed Distribution', fontsize=14, fontweight='bold')
         self.ax.legend(loc='best')
         self.ax.grid(True, alpha=0.3, axis='y')
-        self.figure.tight_layout()
-        self.canvas.draw()
+        self._tight_layout()
+        self.canvas.draw_idle()
 
 
 class PositionChart(BaseChart):
@@ -253,31 +390,33 @@ class PositionChart(BaseChart):
         Args:
             df (pd.DataFrame): Telemetry dataframe with POSITION column.
         """
+        if self._unchanged(df):
+            return
         self.ax.clear()
         
         if df is None or df.empty:
             self.ax.text(0.5, 0.5, 'No data available', 
                         ha='center', va='center', transform=self.ax.transAxes)
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
         
         if 'POSITION' not in df.columns:
             self.ax.text(0.5, 0.5, 'POSITION column not found', 
                         ha='center', va='center', transform=self.ax.transAxes)
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
         
         # Plot position by driver
         if 'DRIVER' in df.columns and 'NUMBER' in df.columns:
-            for driver_num in df['NUMBER'].unique():
-                driver_data = df[df['NUMBER'] == driver_num].copy()
-                driver_data = driver_data.sort_index()
-                
-                driver_name = driver_data['DRIVER'].iloc[0] if not driver_data.empty else f"Car #{driver_num}"
+            # Groups keep row order, so they only need sorting if df does
+            index_sorted = df.index.is_monotonic_increasing
+            for driver_name, driver_data in self._driver_groups(df):
+                if not index_sorted:
+                    driver_data = driver_data.sort_index()
                 
-                valid_data = driver_data[driver_data['POSITION'].notna()]
+                valid_data = driver_data['POSITION'].dropna()
                 if not valid_data.empty:
-                    self.ax.plot(valid_data.index, valid_data['POSITION'], 
+                    self.ax.plot(valid_data.index, valid_data, 
                                marker='o', label=driver_name, linewidth=2, markersize=6)
         else:
             valid_data = df[df['POSITION'].notna()]
@@ -291,8 +430,8 @@ class PositionChart(BaseChart):
         self.ax.invert_yaxis()  # Position 1 at top
         self.ax.legend(loc='best')
         self.ax.grid(True, alpha=0.3)
-        self.figure.tight_layout()
-        self.canvas.draw()
+        self._tight_layout()
+        self.canvas.draw_idle()
 
 
 class DynamicChart(BaseChart):
@@ -304,7 +443,8 @@ class DynamicChart(BaseChart):
         """Initialize the dynamic chart."""
         super().__init__(parent)
         
-    def plot(self, df: pd.DataFrame, x_col: str, y_col: str, chart_type: str = 'line'):
+    def plot(self, df: pd.DataFrame, x_col: str, y_col: str, chart_type: str = 'line',
+             title: str = None):
         """
         Plot data based on selected columns.
         
@@ -313,49 +453,56 @@ class DynamicChart(BaseChart):
             x_col (str): Column for X axis.
             y_col (str): Column for Y axis.
             chart_type (str): 'line', 'scatter', or 'bar'.
+            title (str, optional): Title to show, in a smaller font, instead
+                of "y_col vs x_col".
         """
+        if self._unchanged(df, x_col, y_col, chart_type, title):
+            return
         self.ax.clear()
         
         if df is None or df.empty:
             self.ax.text(0.5, 0.5, 'No data available', 
                         ha='center', va='center', transform=self.ax.transAxes)
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
             
         if x_col not in df.columns or y_col not in df.columns:
             self.ax.text(0.5, 0.5, f'Columns not found: {x_col}, {y_col}', 
                         ha='center', va='center', transform=self.ax.transAxes)
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
             
         # Plot by driver if available
         if 'DRIVER' in df.columns and 'NUMBER' in df.columns:
-            for driver_num in df['NUMBER'].unique():
-                driver_data = df[df['NUMBER'] == driver_num].copy()
+            numeric = (pd.api.types.is_numeric_dtype(df[x_col])
+                       and pd.api.types.is_numeric_dtype(df[y_col]))
+            for driver_name, driver_data in self._driver_groups(df):
+                if numeric:
+                    # Sort by X and drop missing points on the raw arrays
+                    x, y = sort_and_drop_nan(
+                        driver_data[x_col].to_numpy(dtype=float, na_value=np.nan),
+                        driver_data[y_col].to_numpy(dtype=float, na_value=np.nan))
+                else:
+                    # Sort by X if it's time-based or sequential
+                    if pd.api.types.is_numeric_dtype(driver_data[x_col]):
+                        driver_data = driver_data.sort_values(x_col)
+                    
+                    valid_data = driver_data.dropna(subset=[x_col, y_col])
+                    x, y = valid_data[x_col], valid_data[y_col]
                 
-                # Sort by X if it's time-based or sequential
-                if pd.api.types.is_numeric_dtype(driver_data[x_col]):
-                    driver_data = driver_data.sort_values(x_col)
-                
-                driver_name = driver_data['DRIVER'].iloc[0] if not driver_data.empty else f"Car #{driver_num}"
-                
-                valid_data = driver_data.dropna(subset=[x_col, y_col])
-                
-                if not valid_data.empty:
+                if len(x):
                     if chart_type == 'line':
-                        self.ax.plot(valid_data[x_col], valid_data[y_col], 
+                        self.ax.plot(*self._line_points(x, y), 
                                    marker='o', label=driver_name, linewidth=2, markersize=4)
                     elif chart_type == 'scatter':
-                        self.ax.scatter(valid_data[x_col], valid_data[y_col], 
-                                      label=driver_name, alpha=0.7)
+                        self.ax.scatter(x, y, label=driver_name, alpha=0.7)
                     elif chart_type == 'bar':
-                        self.ax.bar(valid_data[x_col], valid_data[y_col], 
-                                  label=driver_name, alpha=0.7)
+                        self.ax.bar(x, y, label=driver_name, alpha=0.7)
         else:
             valid_data = df.dropna(subset=[x_col, y_col])
             if not valid_data.empty:
                 if chart_type == 'line':
-                    self.ax.plot(valid_data[x_col], valid_data[y_col], marker='o')
+                    self.ax.plot(*self._line_points(valid_data[x_col], valid_data[y_col]), marker='o')
                 elif chart_type == 'scatter':
                     self.ax.scatter(valid_data[x_col], valid_data[y_col])
                 elif chart_type == 'bar':
@@ -363,7 +510,10 @@ class DynamicChart(BaseChart):
         
         self.ax.set_xlabel(x_col, fontsize=12, fontweight='bold')
         self.ax.set_ylabel(y_col, fontsize=12, fontweight='bold')
-        self.ax.set_title(f'{y_col} vs {x_col}', fontsize=14, fontweight='bold')
+        if title is None:
+            self.ax.set_title(f'{y_col} vs {x_col}', fontsize=14, fontweight='bold')
+        else:
+            self.ax.set_title(title, fontsize=12, fontweight='bold')
         
         if chart_type != 'bar':
             self.ax.grid(True, alpha=0.3)
@@ -371,8 +521,29 @@ class DynamicChart(BaseChart):
         if 'DRIVER' in df.columns:
             self.ax.legend(loc='best')
             
-        self.figure.tight_layout()
-        self.canvas.draw()
+        self._tight_layout()
+        self.canvas.draw_idle()
+
+    def _line_points(self, x, y):
+        """
+        Return the x and y values to draw as a line.
+        
+        Numeric traces with more than two points per pixel of canvas width
+        are reduced to the min and max of each bucket, which draws the
+        same line with far fewer vertices.
+        
+        Args:
+            x (pd.Series or np.ndarray): X values, without missing points.
+            y (pd.Series or np.ndarray): Y values, same length as x.
+        
+        Returns:
+            tuple: (x, y) values.
+        """
+        ds = len(x) // (2 * max(1, self.canvas.width()))
+        if ds <= 1 or not (pd.api.types.is_numeric_dtype(x)
+                           and pd.api.types.is_numeric_dtype(y)):
+            return x, y
+        return minmax_downsample(np.asarray(x, dtype=float), np.asarray(y, dtype=float), ds)
 
 
 class SmartDashboard(QWidget):
@@ -381,6 +552,33 @@ class SmartDashboard(QWidget):
     based on the available data columns.
     """
     
+    # (role, any of, all of, none of): keywords a column name must contain;
+    # each role takes the first matching column
+    COLUMN_ROLES = (
+        ('time', ('TIME', 'SESSION'), (), ()),
+        ('lap', ('LAP',), (), ('TIME',)),
+        ('lap_time', ('LAP',), ('TIME',), ()),
+        ('speed', ('SPEED', 'KPH', 'MPH'), (), ()),
+        ('pos', ('POS',), (), ()),
+        ('throttle', ('THROT', 'PEDAL'), (), ()),
+        ('brake', ('BRAKE',), (), ()),
+        ('rpm', ('RPM', 'ENGINE'), (), ()),
+        ('gear', ('GEAR',), (), ()),
+    )
+    
+    # (title, x roles, y role, chart type, unless role): the x axis uses the
+    # first x role found; a rule is skipped when its unless role is present
+    CHART_RULES = (
+        ('Speed Trace', ('time',), 'speed', 'line', None),
+        ('Lap Time Progression', ('lap',), 'lap_time', 'line', None),
+        # Without an explicit lap number, fall back to a distribution
+        ('Lap Time Distribution', ('lap_time',), 'lap_time', 'bar', 'lap'),
+        ('Position History', ('lap', 'time'), 'pos', 'line', None),
+        ('Throttle Application', ('time',), 'throttle', 'line', None),
+        ('Braking Profile', ('time',), 'brake', 'line', None),
+        ('Gearing Analysis (RPM vs Speed)', ('speed',), 'rpm', 'scatter', None),
+    )
+    
     def __init__(self, parent=None):
         """Initialize the smart dashboard."""
         super().__init__(parent)
@@ -393,7 +591,51 @@ class SmartDashboard(QWidget):
         self.layout.addWidget(self.scroll)
         
         self.charts = []
+        # Chart widgets kept across dashboards; the first len(self.charts) are shown
+        self._chart_pool = []
+        # Column names -> charts to create for the last dashboard
+        self._column_cache = (None, None)
+        
+    @classmethod
+    def _detect_roles(cls, columns):
+        """
+        Assign columns to chart roles in a single pass over the names.
+        
+        Args:
+            columns (list): Upper-cased column names.
+        
+        Returns:
+            dict: Role name to the first column matching it.
+        """
+        roles = {}
+        for col in columns:
+            for role, any_of, all_of, none_of in cls.COLUMN_ROLES:
+                if (role not in roles and any(k in col for k in any_of)
+                        and all(k in col for k in all_of) and not any(k in col for k in none_of)):
+                    roles[role] = col
+            if len(roles) == len(cls.COLUMN_ROLES):
+                break
+        return roles
+    
+    @classmethod
+    def _select_charts(cls, roles, col_map):
+        """
+        Pick the charts to create from the detected column roles.
         
+        Args:
+            roles (dict): Role name to upper-cased column name.
+            col_map (dict): Upper-cased column name to original name.
+        
+        Returns:
+            list: (title, x column, y column, chart type) tuples.
+        """
+        charts = []
+        for title, x_roles, y_role, chart_type, unless in cls.CHART_RULES:
+            x_col = next((roles[r] for r in x_roles if r in roles), None)
+            if x_col and y_role in roles and unless not in roles:
+                charts.append((title, col_map[x_col], col_map[roles[y_role]], chart_type))
+        return charts
+    
     def generate_dashboard(self, df: pd.DataFrame):
         """
         Analyze data and generate the most relevant charts automatically.
@@ -401,106 +643,39 @@ class SmartDashboard(QWidget):
         Args:
             df (pd.DataFrame): The telemetry data.
         """
-        # Clear existing charts
+        # Take existing charts out of the grid; they are reused below
         for i in reversed(range(self.content_layout.count())): 
-            self.content_layout.itemAt(i).widget().setParent(None)
+            widget = self.content_layout.itemAt(i).widget()
+            self.content_layout.removeWidget(widget)
+            widget.hide()
         self.charts = []
         
         if df is None or df.empty:
             return
 
-        columns = [c.upper() for c in df.columns]
-        col_map = {c.upper(): c for c in df.columns}
-        
-        # 1. Identify Key Columns using heuristics
-        time_col = next((c for c in columns if 'TIME' in c or 'SESSION' in c), None)
-        lap_col = next((c for c in columns if 'LAP' in c and 'TIME' not in c), None)
-        speed_col = next((c for c in columns if 'SPEED' in c or 'KPH' in c or 'MPH' in c), None)
-        pos_col = next((c for c in columns if 'POS' in c), None)
-        throttle_col = next((c for c in columns if 'THROT' in c or 'PEDAL' in c), None)
-        brake_col = next((c for c in columns if 'BRAKE' in c), None)
-        rpm_col = next((c for c in columns if 'RPM' in c or 'ENGINE' in c), None)
-        gear_col = next((c for c in columns if 'GEAR' in c), None)
-        
-        charts_to_create = []
-        
-        # 2. AI Decision Logic: Determine best visualizations
-        
-        # A. Speed Trace (Speed vs Time/Distance)
-        if speed_col and time_col:
-            charts_to_create.append({
-                'title': 'Speed Trace',
-                'x': col_map[time_col],
-                'y': col_map[speed_col],
-                'type': 'line'
-            })
-            
-        # B. Lap Time Progression (Lap Time vs Lap Number)
-        # Assuming we have a lap time column (often same as time_col if it's 'LAP_TIME')
-        lap_time_col = next((c for c in columns if 'LAP' in c and 'TIME' in c), None)
-        if lap_time_col and lap_col:
-            charts_to_create.append({
-                'title': 'Lap Time Progression',
-                'x': col_map[lap_col],
-                'y': col_map[lap_time_col],
-                'type': 'line'
-            })
-        elif lap_time_col:
-             # If no explicit lap number, use index
-             charts_to_create.append({
-                'title': 'Lap Time Distribution',
-                'x': col_map[lap_time_col], # Histogram logic handled by chart type or pre-processing
-                'y': col_map[lap_time_col],
-                'type': 'bar' # Placeholder for distribution
-            })
-
-        # C. Driver Position Changes
-        if pos_col and (lap_col or time_col):
-            charts_to_create.append({
-                'title': 'Position History',
-                'x': col_map[lap_col] if lap_col else col_map[time_col],
-                'y': col_map[pos_col],
-                'type': 'line'
-            })
-            
-        # D. Telemetry Overview (Throttle/Brake vs Time)
-        if throttle_col and time_col:
-             charts_to_create.append({
-                'title': 'Throttle Application',
-                'x': col_map[time_col],
-                'y': col_map[throttle_col],
-                'type': 'line'
-            })
-            
-        if brake_col and time_col:
-             charts_to_create.append({
-                'title': 'Braking Profile',
-                'x': col_map[time_col],
-                'y': col_map[brake_col],
-                'type': 'line'
-            })
-
-        # E. Engine Performance (RPM vs Speed)
-        if rpm_col and speed_col:
-            charts_to_create.append({
-                'title': 'Gearing Analysis (RPM vs Speed)',
-                'x': col_map[speed_col],
-                'y': col_map[rpm_col],
-                'type': 'scatter'
-            })
+        # 1. Identify Key Columns using heuristics and 2. determine the best
+        # visualizations; both depend only on the column names, so a refresh
+        # of the same data reuses them
+        names = tuple(df.columns)
+        if self._column_cache[0] == names:
+            charts_to_create = self._column_cache[1]
+        else:
+            col_map = {c.upper(): c for c in df.columns}
+            roles = self._detect_roles(list(col_map))
+            charts_to_create = self._select_charts(roles, col_map)
+            self._column_cache = (names, charts_to_create)
 
         # 3. Generate Layout
         row = 0
         col = 0
         max_cols = 2
         
-        for chart_info in charts_to_create:
-            chart_widget = DynamicChart()
-            chart_widget.plot(df, chart_info['x'], chart_info['y'], chart_info['type'])
-            chart_widget.ax.set_title(chart_info['title'], fontsize=12, fontweight='bold')
-            chart_widget.canvas.draw()
+        for i, (title, x_col, y_col, chart_type) in enumerate(charts_to_create):
+            chart_widget = self._pooled_chart(i)
+            chart_widget.plot(df, x_col, y_col, chart_type, title=title)
             
             self.content_layout.addWidget(chart_widget, row, col)
+            chart_widget.show()
             self.charts.append(chart_widget)
             
             col += 1
@@ -512,6 +687,13 @@ class SmartDashboard(QWidget):
         if not charts_to_create:
             numeric_cols = df.select_dtypes(include=[np.number]).columns
             if len(numeric_cols) >= 2:
-                chart_widget = DynamicChart()
+                chart_widget = self._pooled_chart(0)
                 chart_widget.plot(df, numeric_cols[0], numeric_cols[1], 'scatter')
                 self.content_layout.addWidget(chart_widget, 0, 0)
+                chart_widget.show()
+    
+    def _pooled_chart(self, i: int) -> DynamicChart:
+        """Return the i-th pooled chart widget, creating charts as the pool runs short."""
+        while len(self._chart_pool) <= i:
+            self._chart_pool.append(DynamicChart())
+        return self._chart_pool[i]
@@ -10,17 +10,18 @@ from src.ai.models import LapTimePredictor, AnomalyDetector, RaceCoach
 
 def test_ai():
     print("Testing AI Models...")
+    rng = np.random.default_rng(0)
     
     # Test LapTimePredictor
     model = LapTimePredictor(input_size=5, hidden_size=10)
-    dummy_input = np.random.randn(1, 10, 5) # Batch=1, Seq=10, Feat=5
+    dummy_input = rng.standard_normal((1, 10, 5), dtype=np.float32) # Batch=1, Seq=10, Feat=5
     output = model.forward(dummy_input)
     print(f"LapTimePredictor Output Shape: {output.shape}")
     assert output.shape == (1, 1)
     
     # Test AnomalyDetector
     detector = AnomalyDetector()
-    data = np.random.rand(100, 5)
+    data = rng.random((100, 5), dtype=np.float32)
     detector.train(data)
     preds = detector.predict(data[:5])
     print(f"AnomalyDetector Predictions: {preds}")
@@ -17,10 +17,42 @@ from src.core.data_loader import DataLoader
 from src.ai.models import AnomalyDetector, RaceCoach
 
 
+def _load_preprocessed(tmp_path_factory, name, csv_content):
+    """Write csv_content to a temporary file, then load and preprocess it."""
+    csv_file = tmp_path_factory.mktemp("data") / name
+    csv_file.write_text(csv_content)
+    
+    loader = DataLoader()
+    assert loader.load_csv(str(csv_file)) is True
+    return loader.preprocess()
+
+
+@pytest.fixture(scope="module")
+def telemetry_df(tmp_path_factory):
+    """Race results, preprocessed once and shared read-only by the module."""
+    return _load_preprocessed(tmp_path_factory, "telemetry.csv", """POSITION,NUMBER,DRIVER,TEAM,VEHICLE,LAPS,TOTAL_TIME,GAP_FIRST,FL_TIME,FL_KPH,STATUS
+1,14,Jack Hawksworth,Vasser Sullivan,Lexus RC F GT3,50,1:30:45.123,,1:35.678,160.5,Running
+2,3,Jan Heylen,Wright Motorsports,Porsche 911 GT3 R,50,1:30:50.456,+5.333,1:36.123,159.8,Running
+3,93,Racers Edge,Racers Edge,Acura NSX GT3,49,1:31:00.000,+1:14.985,1:37.000,158.0,Running
+4,14,Jack Hawksworth,Vasser Sullivan,Lexus RC F GT3,51,1:32:20.801,,1:35.500,160.7,Running
+5,3,Jan Heylen,Wright Motorsports,Porsche 911 GT3 R,51,1:32:26.579,+5.778,1:36.000,159.9,Running
+""")
+
+
+@pytest.fixture(scope="module")
+def missing_values_df(tmp_path_factory):
+    """Results with empty time cells, preprocessed once and shared read-only."""
+    return _load_preprocessed(tmp_path_factory, "missing.csv", """POSITION,NUMBER,TOTAL_TIME,FL_TIME
+1,14,1:30:45.123,
+2,3,,1:36.123
+3,93,1:31:00.000,1:37.000
+""")
+
+
 class TestEndToEndWorkflow:
     """Test complete data processing workflow."""
     
-    def test_load_and_analyze_workflow(self, tmp_path):
+    def test_load_and_analyze_workflow(self, telemetry_df):
         """
         Test the complete workflow: load CSV -> preprocess -> analyze.
         
@@ -30,21 +62,7 @@ class TestEndToEndWorkflow:
         3. AI models can consume the processed data
         4. Coach generates insights
         """
-        # Arrange: Create test CSV
-        csv_content = """POSITION,NUMBER,DRIVER,TEAM,VEHICLE,LAPS,TOTAL_TIME,GAP_FIRST,FL_TIME,FL_KPH,STATUS
-1,14,Jack Hawksworth,Vasser Sullivan,Lexus RC F GT3,50,1:30:45.123,,1:35.678,160.5,Running
-2,3,Jan Heylen,Wright Motorsports,Porsche 911 GT3 R,50,1:30:50.456,+5.333,1:36.123,159.8,Running
-3,93,Racers Edge,Racers Edge,Acura NSX GT3,49,1:31:00.000,+1:14.985,1:37.000,158.0,Running
-4,14,Jack Hawksworth,Vasser Sullivan,Lexus RC F GT3,51,1:32:20.801,,1:35.500,160.7,Running
-5,3,Jan Heylen,Wright Motorsports,Porsche 911 GT3 R,51,1:32:26.579,+5.778,1:36.000,159.9,Running
-"""
-        csv_file = tmp_path / "telemetry.csv"
-        csv_file.write_text(csv_content)
-        
-        # Act: Load and process
-        loader = DataLoader()
-        assert loader.load_csv(str(csv_file)) is True
-        df = loader.preprocess()
+        df = telemetry_df
         
         # Assert: Data structure
         assert df is not None
@@ -53,9 +71,9 @@ class TestEndToEndWorkflow:
         assert 'FL_TIME_SEC' in df.columns
         
         # Assert: Time conversions
-        assert df.iloc[0]['TOTAL_TIME_SEC'] == pytest.approx(5445.123, rel=1e-3)
-        assert df.iloc[1]['GAP_FIRST_SEC'] == pytest.approx(5.333, rel=1e-3)
-        assert df.iloc[2]['GAP_FIRST_SEC'] == pytest.approx(74.985, rel=1e-3)
+        assert df.at[0, 'TOTAL_TIME_SEC'] == pytest.approx(5445.123, rel=1e-3)
+        assert df.at[1, 'GAP_FIRST_SEC'] == pytest.approx(5.333, rel=1e-3)
+        assert df.at[2, 'GAP_FIRST_SEC'] == pytest.approx(74.985, rel=1e-3)
         
         # Act: Generate coaching insights
         coach = RaceCoach()
@@ -77,7 +95,7 @@ class TestAnomalyDetection:
         Creates a dataset with mostly consistent lap times and one outlier.
         """
         # Arrange: Create synthetic data with outlier
-        normal_laps = np.random.normal(95.0, 0.5, 50)  # Mean 95s, std 0.5s
+        normal_laps = np.random.default_rng(0).normal(95.0, 0.5, 50)  # Mean 95s, std 0.5s
         outlier_lap = np.array([110.0])  # Significantly slower
         all_laps = np.concatenate([normal_laps, outlier_lap])
         
@@ -97,24 +115,14 @@ class TestAnomalyDetection:
 class TestDataQuality:
     """Test data quality and edge cases."""
     
-    def test_handle_missing_values(self, tmp_path):
+    def test_handle_missing_values(self, missing_values_df):
         """Test that missing values are handled gracefully."""
-        csv_content = """POSITION,NUMBER,TOTAL_TIME,FL_TIME
-1,14,1:30:45.123,
-2,3,,1:36.123
-3,93,1:31:00.000,1:37.000
-"""
-        csv_file = tmp_path / "missing.csv"
-        csv_file.write_text(csv_content)
-        
-        loader = DataLoader()
-        loader.load_csv(str(csv_file))
-        df = loader.preprocess()
+        df = missing_values_df
         
         # Assert: NaN values preserved
-        assert pd.isna(df.iloc[0]['FL_TIME_SEC'])
-        assert pd.isna(df.iloc[1]['TOTAL_TIME_SEC'])
-        assert not pd.isna(df.iloc[2]['TOTAL_TIME_SEC'])
+        assert pd.isna(df.at[0, 'FL_TIME_SEC'])
+        assert pd.isna(df.at[1, 'TOTAL_TIME_SEC'])
+        assert not pd.isna(df.at[2, 'TOTAL_TIME_SEC'])
     
     def test_handle_malformed_time_strings(self):
         """Test parsing of edge case time formats."""
@@ -130,6 +138,531 @@ class TestDataQuality:
         assert np.isnan(loader.parse_time_str(""))
         assert np.isnan(loader.parse_time_str("1:2:3:4"))
 
+    def test_arrow_backed_time_columns(self):
+        """Arrow-backed time columns parse the same as object columns."""
+        pytest.importorskip("pyarrow")
+        values = ["1:30:45.123", "+5.333", "+1:14.985", "+1 Lap", "", None]
+
+        loader = DataLoader()
+        loader.raw_data = pd.DataFrame({"GAP_FIRST": pd.Series(values, dtype="string[pyarrow]")})
+        df = loader.preprocess()
+
+        expected = [loader.parse_time_str(v) for v in values]
+        np.testing.assert_allclose(df["GAP_FIRST_SEC"].to_numpy(), expected)
+
+    @pytest.mark.parametrize("dtype", [object, "string[pyarrow]"])
+    def test_arrow_time_parser_matches_scalar(self, dtype):
+        """The Arrow parser returns exactly what parse_time_str returns."""
+        pytest.importorskip("pyarrow")
+        from src.core.data_loader import _parse_time_arrow
+
+        values = ["1:30:45.123", "+5.333", "+1:14.985", "+1 Lap", "", None,
+                  " 1:35.678 ", "1:2:3:4", "invalid", "1e2", "123.456789012345678",
+                  "+ 5", " 1: 35.6", "inf", "-inf", "nan", "1_000", "\uff11\uff12"]
+
+        loader = DataLoader()
+        expected = [loader.parse_time_str(v) for v in values]
+        result = _parse_time_arrow(pd.Series(values, dtype=dtype)).to_numpy()
+        np.testing.assert_array_equal(result, expected)
+
+    def test_numba_time_parser_matches_scalar(self):
+        """The Numba kernel returns exactly what parse_time_str returns."""
+        pytest.importorskip("numba")
+        from src.core.data_loader import _parse_time_numba
+
+        values = ["1:30:45.123", "+5.333", "+1:14.985", "+1 Lap", "", None,
+                  " 1:35.678 ", "1:2:3:4", "invalid", "1e2", 12,
+                  "x" * 100, " " * 80 + "1:35.678",
+                  # Decimals past float64 precision, values only float() knows
+                  "123.456789012345678", "0.1234567890123456789", "1:2.5",
+                  "1.7976931348623157e308", "5e-324", "1e400", "9007199254740993",
+                  "inf", "-inf", "nan", "1_000", "\uff11\uff12", "+ 5", " 1: 35.6",
+                  "5\x1c", "1e5_0"]
+
+        loader = DataLoader()
+        expected = [loader.parse_time_str(v) for v in values]
+        result = _parse_time_numba(pd.Series(values, dtype=object)).to_numpy()
+        np.testing.assert_array_equal(result, expected)
+
+
+class TestSchemaAnalysis:
+    """Test CSV schema analysis behaviour."""
+
+    def test_analysis_cached_until_file_changes(self, tmp_path):
+        """Re-analyzing an unchanged file reuses the cached result."""
+        from src.core.csv_intelligence import CSVSchemaAnalyzer
+
+        csv_file = tmp_path / "schema.csv"
+        csv_file.write_text("POSITION,NUMBER\n1,14\n2,3\n")
+
+        analyzer = CSVSchemaAnalyzer()
+        first = analyzer.analyze_file(str(csv_file))
+        assert analyzer.analyze_file(str(csv_file)) is first
+
+        csv_file.write_text("POSITION,NUMBER,LAPS\n1,14,50\n2,3,50\n3,93,49\n")
+        second = analyzer.analyze_file(str(csv_file))
+        assert second is not first
+        assert second.total_columns == 3
+        # The stale analysis is replaced, not kept alongside
+        assert len(analyzer._cache) == 1
+
+        analyzer.CACHE_SIZE = 2
+        for name in ("a.csv", "b.csv"):
+            (tmp_path / name).write_text("POSITION\n1\n")
+            analyzer.analyze_file(str(tmp_path / name))
+        assert len(analyzer._cache) == 2
+        # The least recently used file was evicted and is analyzed again
+        third = analyzer.analyze_file(str(csv_file))
+        assert third is not second
+        assert analyzer.analyze_file(str(csv_file)) is third
+
+        loader = DataLoader()
+        loader.schema_analyzer = analyzer
+        loader.clear_schema_cache()
+        assert analyzer.analyze_file(str(csv_file)) is not third
+
+    def test_schema_aware_read_matches_pandas(self):
+        """Reading with the detected schema gives the same frame as pd.read_csv."""
+        csv_path = os.path.join(os.path.dirname(__file__), "test_data.csv")
+
+        loader = DataLoader()
+        schema = loader.schema_analyzer.analyze_file(csv_path)
+        df = loader._read_csv(csv_path, schema)
+
+        pd.testing.assert_frame_equal(df, pd.read_csv(csv_path))
+
+    def test_feather_cache_round_trip(self, tmp_path):
+        """A cached reload returns the same frame and is invalidated by edits."""
+        pytest.importorskip("pyarrow")
+        csv_file = tmp_path / "cached.csv"
+        csv_file.write_text("POSITION,DRIVER,FL_TIME\n1,Jack,1:35.678\n2,,1:36.123\n")
+
+        first = DataLoader()
+        assert first.load_csv(str(csv_file), cache=True)
+        cache_dir = tmp_path / ".telemetry_cache"
+        assert len(list(cache_dir.iterdir())) == 1
+
+        second = DataLoader()
+        assert second.load_csv(str(csv_file), cache=True)
+        pd.testing.assert_frame_equal(second.raw_data, first.raw_data)
+
+        csv_file.write_text("POSITION,DRIVER,FL_TIME\n1,Jack,1:35.678\n")
+        third = DataLoader()
+        assert third.load_csv(str(csv_file), cache=True)
+        assert len(third.raw_data) == 1
+        assert len(list(cache_dir.iterdir())) == 1
+
+    def test_low_precision_load_keeps_float32(self, tmp_path):
+        """Float columns read as float32 stay float32 through cleaning."""
+        csv_file = tmp_path / "speeds.csv"
+        csv_file.write_text("POSITION,NUMBER,GAP_FIRST,FL_KPH,SPEED\n"
+                            "1,14,0.0,160.5,201.25\n"
+                            "2,3,5.333,159.8,\n"
+                            "3,93,74.985,158.0,199.5\n"
+                            "4,7,80.5,,198.75\n"
+                            "5,8,81.0,157.1,120.0\n"
+                            "6,9,82.25,156.6,197.0\n")
+
+        for chunksize in (None, 2):
+            df = DataLoader().smart_load(str(csv_file), low_precision=True, chunksize=chunksize)
+            for col in ("GAP_FIRST", "FL_KPH", "SPEED"):
+                assert df[col].dtype == np.float32, (chunksize, col)
+            assert not df[["FL_KPH", "SPEED"]].isna().any().any()
+
+        # The setting applies to that call only, not to the loader's transformer
+        loader = DataLoader()
+        loader.smart_load(str(csv_file), low_precision=True)
+        derived = loader.transformer.generate_derived_features(pd.DataFrame({"POSITION": [1.0, 2.0]}))
+        assert derived["POSITION_CHANGE"].dtype == np.float64
+
+    def test_chunked_load_matches_full_load(self):
+        """Loading in row chunks gives the same result as a single read."""
+        csv_path = os.path.join(os.path.dirname(__file__), "test_data.csv")
+
+        full = DataLoader().smart_load(csv_path)
+        chunked = DataLoader().smart_load(csv_path, chunksize=3)
+
+        pd.testing.assert_frame_equal(chunked, full)
+
+
+class TestFeatureEngineering:
+    """Test derived feature generation."""
+
+    def test_numba_rolling_matches_pandas(self):
+        """The fused rolling kernel matches pandas rolling(3, min_periods=1)."""
+        pytest.importorskip("numba")
+        from src.core.data_transformer import rolling_mean_std_3
+
+        values = np.random.default_rng(0).normal(size=(200, 3))
+        values[::7, 0] = np.nan
+        values[:4, 1] = 1.5
+        values[10:14, 2] = np.nan
+
+        mean, std = np.empty_like(values), np.empty_like(values)
+        rolling_mean_std_3(values, mean, std)
+
+        rolling = pd.DataFrame(values).rolling(window=3, min_periods=1)
+        np.testing.assert_allclose(mean, rolling.mean().to_numpy(), rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(std, rolling.std().to_numpy(), rtol=1e-9, atol=1e-12)
+
+        cumsum = np.empty_like(values)
+        rolling_mean_std_3(values, mean, std, cumsum)
+        np.testing.assert_array_equal(cumsum, pd.DataFrame(values).cumsum().to_numpy())
+
+    def test_speed_conversion_handles_nullable_columns(self):
+        """Nullable speed columns convert like the per-value conversion, NA as NaN."""
+        from src.core.data_transformer import DataTransformer
+
+        transformer = DataTransformer()
+        speeds = pd.Series([150, None, 160, 155], dtype="Int64", name="TOP_SPEED_MPH")
+
+        converted = transformer.detect_and_convert_units(speeds.to_frame())
+
+        expected = speeds.apply(lambda x: transformer.unit_converter.convert_speed(x, "mph", "km/h"))
+        np.testing.assert_allclose(converted["TOP_SPEED_MPH"].to_numpy(dtype=float), expected.to_numpy(dtype=float))
+        assert converted["TOP_SPEED_MPH"].isna().sum() == 1
+
+    def test_rolling_features_handle_nullable_columns(self, monkeypatch):
+        """The Numba path matches the pandas path on nullable columns with NA."""
+        pytest.importorskip("numba")
+        from src.core import data_transformer
+        from src.core.data_transformer import DataTransformer
+
+        df = pd.DataFrame({
+            "LAPS": pd.array([1, None, 3, 4, None, 6, 7, 8], dtype="Int64"),
+            "POSITION": pd.array([3, 2, None, 1, 1, 2, 3, 4], dtype="Int64"),
+            "GAP_FIRST_SEC": pd.array([0.5, None, 1.5, 2.0, 2.5, None, 3.5, 4.0], dtype="Float64"),
+        })
+
+        fast = DataTransformer().engineer_features(df)
+        monkeypatch.setattr(data_transformer, "_HAS_NUMBA", False)
+        slow = DataTransformer().engineer_features(df)
+
+        pd.testing.assert_frame_equal(fast, slow)
+
+    def test_numba_downsample_matches_numpy(self):
+        """The Numba min/max downsampler keeps the same points as the NumPy one."""
+        pytest.importorskip("numba")
+        from src.ui._downsample import _minmax_downsample_numba, _minmax_downsample_numpy
+
+        y = np.random.default_rng(0).normal(size=1003).cumsum()
+        y[::50] = 1.0
+        x = np.arange(len(y), dtype=float)
+
+        for ds in (2, 7, 22, 2000):
+            for fast, slow in zip(_minmax_downsample_numba(x, y, ds), _minmax_downsample_numpy(x, y, ds)):
+                np.testing.assert_array_equal(fast, slow)
+
+
+def _sanitizer_frame():
+    """Mixed-dtype telemetry with outliers, gaps and an all-NaN column."""
+    rng = np.random.default_rng(0)
+    n = 200
+    df = pd.DataFrame({
+        "FL_KPH": rng.normal(160.0, 2.0, n),
+        "GAP_FIRST_SEC": rng.exponential(5.0, n),
+        "LAPS": rng.integers(40, 60, n),
+        "PIT_STOPS": rng.integers(0, 2, n) * 4,
+        "EMPTY": np.nan,
+        "DRIVER": rng.choice(["Jack", "Jan", "Racers"], n),
+        "RUNNING": rng.random(n) > 0.1,
+    })
+    df.loc[::17, "FL_KPH"] = 260.0
+    df.loc[::23, "GAP_FIRST_SEC"] = np.nan
+    df.loc[5, "LAPS"] = 400
+    return df
+
+
+def _per_column_outliers(df):
+    """IQR capping one column at a time, as the sanitizer did before its block rewrite."""
+    df = df.copy()
+    detected = 0
+    for col in df.select_dtypes(include=[np.number]).columns:
+        if df[col].isna().all():
+            continue
+        q1, q3 = df[col].quantile(0.25), df[col].quantile(0.75)
+        lower, upper = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+        outliers = (df[col] < lower) | (df[col] > upper)
+        if outliers.sum() > 0:
+            detected += outliers.sum()
+            df.loc[df[col] < lower, col] = lower
+            df.loc[df[col] > upper, col] = upper
+    return df, detected
+
+
+def _per_column_normalize(df):
+    """StandardScaler fitted one column at a time, as before the block rewrite."""
+    from sklearn.preprocessing import StandardScaler
+
+    df = df.copy()
+    for col in df.select_dtypes(include=[np.number]).columns:
+        if not df[col].isna().all():
+            df[col] = StandardScaler().fit_transform(df[col].to_numpy().reshape(-1, 1))
+    return df
+
+
+class TestDataSanitizer:
+    """Test the sanitizer's bulk numeric paths against per-column pandas results."""
+
+    def test_imputation_matches_per_column(self):
+        """Bulk imputation fills the same values as the per-column loop."""
+        from src.core.data_sanitizer import DataSanitizer
+
+        df = _sanitizer_frame()
+        df.loc[::2, "LAPS"] = np.nan  # over 30% missing: forward/backward fill
+        df.loc[::9, "DRIVER"] = None
+
+        expected = df.copy()
+        for col in ["FL_KPH", "GAP_FIRST_SEC", "LAPS", "DRIVER"]:
+            if col == "DRIVER":
+                expected[col] = expected[col].fillna(expected[col].mode()[0])
+            elif expected[col].isna().mean() < 0.3:
+                expected[col] = expected[col].fillna(expected[col].median())
+            else:
+                expected[col] = expected[col].ffill().bfill()
+
+        imputed, count = DataSanitizer()._impute_missing_values(df, copy=True)
+
+        # The all-NaN column counts as imputed but has no median and stays empty
+        assert count == df.isna().sum().sum()
+        pd.testing.assert_frame_equal(imputed, expected)
+
+    def test_duplicate_column_names_renamed_like_read_csv(self):
+        """Repeated column names get .1, .2 suffixes in order."""
+        from src.core.data_sanitizer import DataSanitizer
+
+        df = pd.DataFrame([[1.0, 2.0, 3.0, 4.0]], columns=["SPEED", "RPM", "SPEED", "SPEED"])
+        cleaned, report = DataSanitizer().clean_data(df, correct_outliers=False)
+
+        assert list(cleaned.columns) == ["SPEED", "RPM", "SPEED.1", "SPEED.2"]
+        assert "Duplicate column names detected and renamed" in report.warnings
+
+    def test_outlier_detector_matches_fit_predict(self):
+        """Below the subsample size, detect flags what fit_predict flags, refit or not."""
+        from sklearn.ensemble import IsolationForest
+        from src.core.data_sanitizer import OutlierDetector
+
+        df = _sanitizer_frame()
+        numeric = df[["FL_KPH", "GAP_FIRST_SEC", "LAPS", "PIT_STOPS"]]
+        X = numeric.fillna(numeric.median()).to_numpy()
+        expected = IsolationForest(contamination=0.1, random_state=42).fit_predict(X) == -1
+
+        detector = OutlierDetector(contamination=0.1)
+        np.testing.assert_array_equal(detector.detect(numeric), expected)
+        np.testing.assert_array_equal(detector.detect(numeric, refit=False), expected)
+
+    def test_outlier_correction_matches_per_column(self, monkeypatch):
+        """Block IQR capping, serial or threaded, matches the per-column loop."""
+        import warnings
+        from src.core import data_sanitizer
+
+        df = _sanitizer_frame()
+        with warnings.catch_warnings():
+            # .loc setting a fractional bound into an int column warns and upcasts
+            warnings.simplefilter("ignore", FutureWarning)
+            expected, detected = _per_column_outliers(df)
+
+        for cpus in (1, 4):
+            monkeypatch.setattr(data_sanitizer.os, "cpu_count", lambda: cpus)
+            corrected, stats = data_sanitizer.DataSanitizer()._correct_outliers(df, copy=True)
+            assert stats == {"detected": detected, "corrected": detected}
+            pd.testing.assert_frame_equal(corrected, expected)
+        assert detected > 0
+
+    def test_normalize_matches_per_column(self):
+        """Block scaling matches per-column StandardScaler values and dtypes."""
+        from src.core.data_sanitizer import DataSanitizer
+
+        df = _sanitizer_frame()
+        df["FL_KPH_32"] = df["FL_KPH"].astype(np.float32)
+
+        normalized = DataSanitizer()._normalize_data(df, copy=True)
+
+        pd.testing.assert_frame_equal(normalized, _per_column_normalize(df), rtol=1e-6)
+        assert normalized["FL_KPH"].dtype == np.float64
+        assert normalized["FL_KPH_32"].dtype == np.float32
+
+        low_precision = df[["FL_KPH_32"]]
+        pd.testing.assert_frame_equal(DataSanitizer()._normalize_data(low_precision, copy=True),
+                                      _per_column_normalize(low_precision), rtol=1e-6)
+
+    def test_copy_flags(self):
+        """copy=True leaves the input alone; the default works on it in place."""
+        from src.core.data_sanitizer import DataSanitizer
+
+        sanitizer = DataSanitizer()
+        steps = [
+            lambda df, copy: sanitizer._impute_missing_values(df, copy=copy)[0],
+            lambda df, copy: sanitizer._correct_outliers(df, copy=copy)[0],
+            lambda df, copy: sanitizer._normalize_data(df, copy=copy),
+        ]
+        for step in steps:
+            df = _sanitizer_frame()
+            original = df.copy()
+            result = step(df, True)
+            assert result is not df
+            pd.testing.assert_frame_equal(df, original)
+
+            in_place = step(df, False)
+            assert in_place is df
+            pd.testing.assert_frame_equal(in_place, result)
+
+    def test_median_imputation_keeps_dtypes(self):
+        """Median fills keep float32 and nullable Int64 columns in their dtype."""
+        from src.core.data_sanitizer import DataSanitizer, SmartImputer
+
+        df = pd.DataFrame({
+            "FL_KPH": pd.Series([160.5, np.nan, 159.8, 158.0], dtype="float32"),
+            "LAPS": pd.Series([50, pd.NA, 49, 51], dtype="Int64"),
+        })
+        expected = df.fillna(df.median())
+
+        imputed, count = DataSanitizer()._impute_missing_values(df, copy=True)
+        assert count == 2
+        pd.testing.assert_frame_equal(imputed, expected)
+        pd.testing.assert_frame_equal(SmartImputer(strategy="simple").fit_transform(df), expected)
+
+    def test_outlier_capping_keeps_dtypes(self):
+        """Capped columns keep their dtype; integers stay integer while the bounds are whole."""
+        from src.core.data_sanitizer import DataSanitizer
+
+        df = pd.DataFrame({
+            "FL_KPH": pd.Series([158.0, 158.5, 159.0, 159.5, 160.0, 160.5, 161.0, 161.5, 250.0],
+                                dtype="float32"),
+            "LAPS": pd.Series([10, 11, 12, 13, 14, 15, 16, 17, 60], dtype="int64"),
+            "GAP": [1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0],
+        })
+
+        corrected, stats = DataSanitizer()._correct_outliers(df, copy=True)
+
+        assert stats == {"detected": 2, "corrected": 2}
+        assert corrected.dtypes.to_dict() == df.dtypes.to_dict()
+        assert corrected.at[8, "FL_KPH"] == np.float32(161.0 + 1.5 * 2.0)
+        assert corrected.at[8, "LAPS"] == 22
+        pd.testing.assert_frame_equal(corrected.iloc[:8], df.iloc[:8])
+
+
+class TestTelemetryPivot:
+    """Test pivoting long-format telemetry to wide format."""
+
+    def test_pivot_matches_pivot_table(self):
+        """Same values and column order as pivot_table; rows in first-appearance order."""
+        from src.core.data_transformer import DataTransformer
+
+        df = pd.DataFrame({
+            "timestamp": [3, 3, 1, 1, 2, 3, 2, 1],
+            "vehicle_id": ["GR86-2", "GR86-2", "GR86-1", "GR86-1", "GR86-1", "GR86-2", "GR86-1", "GR86-1"],
+            "telemetry_name": ["speed", "gear", "speed", "aps", "gear", "speed", "speed", "speed"],
+            "telemetry_value": [180.5, 4.0, 150.0, np.nan, 3.0, 181.0, 160.25, 151.0],
+        })
+        keys = ["timestamp", "vehicle_id"]
+
+        pivoted = DataTransformer().pivot_telemetry_data(df)
+        expected = df.pivot_table(index=keys, columns="telemetry_name", values="telemetry_value",
+                                  aggfunc="first").reset_index()
+
+        assert list(pivoted.columns) == list(expected.columns)
+        assert list(pivoted[keys].itertuples(index=False)) == [(3, "GR86-2"), (1, "GR86-1"), (2, "GR86-1")]
+        pd.testing.assert_frame_equal(pivoted.sort_values(keys, ignore_index=True), expected)
+
+
+class TestExport:
+    """Test CSV export."""
+
+    def test_csv_export_matches_to_csv(self, tmp_path):
+        """Exported files are byte-identical to df.to_csv and read back to the same frame."""
+        from src.core.export import CSVExporter
+
+        frames = [
+            pd.DataFrame({"LAP_TIME_SEC": [95.0, 96.0], "GAP": [1.5e-07, 2.0], "DRIVER": ["Jack", "Jan"]}),
+            pd.DataFrame({"LAP": [1, 2], "DRIVER": ["Jack", None], "PITS": pd.array([1, None], dtype="Int64"),
+                          "STATUS": pd.Categorical(["Running", "Retired"])}),
+            pd.DataFrame({"DRIVER": ["Hawksworth, Jack", 'Jan "JH" Heylen'], "LAP": [1, 2]}),
+            pd.DataFrame({"LAP": [1, 2], "DRIVER": ["", "Jan"]}, index=pd.Index([14, 3], name="NUMBER")),
+            pd.DataFrame({"DRIVER": ["", "Jan"]}),
+            pd.DataFrame({"LAP": [1, 2], "NOTES": [95.0, "wet"]}),
+        ]
+        path = tmp_path / "export.csv"
+
+        for df in frames:
+            for include_index in (False, True):
+                assert CSVExporter.export(df, str(path), include_index=include_index)
+                assert path.read_text() == df.to_csv(index=include_index)
+
+        df = frames[0]
+        CSVExporter.export(df, str(path))
+        pd.testing.assert_frame_equal(pd.read_csv(path), df)
+
+
+class TestMultiFileImport:
+    """Test importing several files at once."""
+
+    def test_import_matches_read_csv(self, tmp_path):
+        """Files sharing a header reuse column types and still read like pd.read_csv."""
+        pytest.importorskip("pyarrow")
+        from src.core.multi_file_manager import MultiFileManager
+
+        header = "DATE,FL_TIME,LAPS,FL_KPH,DRIVER,NOTES\n"
+        (tmp_path / "a.csv").write_text(header + "2024-01-01,1:35.678,50,160.5,Jack,\n"
+                                                 "2024-01-02,1:36.123,51,159.8,,\n")
+        (tmp_path / "b.csv").write_text(header + "2024-01-03,1:37.000,,158.0,Jan,wet\n")
+        paths = [str(tmp_path / "a.csv"), str(tmp_path / "b.csv")]
+
+        files = MultiFileManager().import_multiple_files(paths)
+
+        for path in paths:
+            expected = pd.read_csv(path, float_precision="round_trip")
+            pd.testing.assert_frame_equal(files[os.path.basename(path)], expected)
+
+    def test_index_join_matches_chained_merge(self):
+        """Joining on the index gives the chained merge's frame, repeated labels included."""
+        from src.core.multi_file_manager import MultiFileManager
+
+        for index in ([0, 1], [0, 0]):
+            result = pd.DataFrame({"LAP": [1, 2], "FL_KPH": [160.5, 159.8]}, index=index)
+            others = [(1, pd.DataFrame({"FL_KPH": [158.0, 157.1]}, index=[0, 1])),
+                      (2, pd.DataFrame({"LAP": [3, 4]}, index=[1, 2]))]
+
+            expected = result
+            for i, df in others:
+                expected = expected.merge(df, left_index=True, right_index=True, how="outer",
+                                          suffixes=("", f"_{i}"))
+
+            pd.testing.assert_frame_equal(MultiFileManager._join_on_index(result, others), expected)
+
+    def test_similarity_cache_is_bounded(self):
+        """Similarity matrices are reused, including swapped, and the oldest is evicted."""
+        from src.core.multi_file_manager import MultiFileManager
+
+        manager = MultiFileManager()
+        manager.SIMILARITY_CACHE_SIZE = 2
+        scores = manager._similarity_scores(("lap", "speed"), ("laps",), 50)
+        np.testing.assert_array_equal(manager._similarity_scores(("laps",), ("lap", "speed"), 50), scores.T)
+
+        manager._similarity_scores(("a",), ("b",), 50)
+        manager._similarity_scores(("c",), ("d",), 50)
+        assert len(manager._similarity_cache) == 2
+        assert (("lap", "speed"), ("laps",), 50) not in manager._similarity_cache
+
+    def test_sampled_key_screen_matches_full_pass(self):
+        """On a long frame, screening keys on a sample keeps the keys the full pass picks."""
+        from src.core.multi_file_manager import MultiFileManager
+
+        n, n_tail = 120_000, 12_040
+        # One dominant value plus a tail of unique ids, just over the 0.1 cut;
+        # the sample of these rows holds slightly fewer than a tenth of them
+        gap_id = np.full(n, -1)
+        gap_id[np.random.default_rng(2).choice(n, n_tail, replace=False)] = np.arange(n_tail)
+        df = pd.DataFrame({"LAP": np.arange(n) // 2, "DRIVER": np.arange(n) % 10, "GAP_ID": gap_id})
+        columns = ["LAP", "DRIVER", "GAP_ID"]
+
+        full = MultiFileManager()
+        full.KEY_SAMPLE_ROWS = n
+        expected = full._suggest_join_keys(df, df, columns)
+
+        assert expected == ["LAP", "GAP_ID"]
+        assert MultiFileManager()._suggest_join_keys(df, df, columns) == expected
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])